@@ -0,0 +1,55 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -O3 -march=native -fopenmp
+# distutils: extra_link_args = -fopenmp
+"""
+Compiled Game of Life stencil for :class:`game_of_life.DenseGameOfLife`.
+
+Build in place with ``cythonize -i _life_kernel.pyx``. When the extension is not
+built, :class:`~game_of_life.DenseGameOfLife` falls back to its Numba or NumPy path.
+"""
+
+from cython.parallel cimport prange
+
+
+def step_kernel(unsigned char[:, ::1] grid_in, unsigned char[:, ::1] grid_out, bint wrap):
+    """
+    Computes one generation of a padded grid into another padded grid.
+
+    Both buffers carry a one-cell halo. For a toroidal grid the halo of ``grid_in``
+    is first refreshed from the opposite edges; otherwise it is left empty. Rows are
+    split statically across OpenMP threads with the GIL released; each row is a
+    plain contiguous loop that the C compiler vectorizes.
+
+    Args:
+        grid_in (np.ndarray): The current ``uint8`` grid.
+        grid_out (np.ndarray): The ``uint8`` buffer receiving the next generation.
+        wrap (bool): If True, the grid is toroidal.
+    """
+    cdef Py_ssize_t rows = grid_in.shape[0]
+    cdef Py_ssize_t cols = grid_in.shape[1]
+    cdef Py_ssize_t y, x
+    cdef unsigned char n
+    cdef const unsigned char *above
+    cdef const unsigned char *row
+    cdef const unsigned char *below
+    cdef unsigned char *out
+    with nogil:
+        if wrap:
+            # Rows first, so that the column copy also fills the four corners.
+            for x in range(1, cols - 1):
+                grid_in[0, x] = grid_in[rows - 2, x]
+                grid_in[rows - 1, x] = grid_in[1, x]
+            for y in range(rows):
+                grid_in[y, 0] = grid_in[y, cols - 2]
+                grid_in[y, cols - 1] = grid_in[y, 1]
+        for y in prange(1, rows - 1, schedule="static"):
+            # Raw row pointers keep the inner loop free of stride arithmetic.
+            above = &grid_in[y - 1, 0]
+            row = &grid_in[y, 0]
+            below = &grid_in[y + 1, 0]
+            out = &grid_out[y, 0]
+            for x in range(1, cols - 1):
+                n = (above[x - 1] + above[x] + above[x + 1]
+                     + row[x - 1] + row[x + 1]
+                     + below[x - 1] + below[x] + below[x + 1])
+                out[x] = (n == 3) | ((n == 2) & (row[x] == 1))
@@ -0,0 +1,22 @@
+"""
+Ahead-of-time compiles the Numba stencil kernel into the ``gol_kernel`` extension.
+
+Run ``python build_gol_kernel.py`` once (Numba required) to write
+``gol_kernel.*.so`` next to ``game_of_life.py``. When the extension is present,
+:class:`game_of_life.DenseGameOfLife` uses it directly, so the first generation
+no longer waits for Numba to compile or load its cached kernel. The AOT kernel is
+single-threaded; the JIT kernel spreads large boards across cores.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from game_of_life import _step_kernel
+
+cc = CC("gol_kernel")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export("step_kernel", "void(u1[:, ::1], u1[:, ::1], b1)")(_step_kernel.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
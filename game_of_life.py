@@ -6,21 +6,274 @@ Two modes are supported:
 - Toroidal (wrap=True): Edges wrap around, and coordinates are normalized modulo width/height.
 - Bounded (wrap=False): Edges are hard boundaries, and out-of-range coordinates are ignored.
 
-The internal representation uses a set of (x, y) integer tuples where:
+The public API takes and returns sets of (x, y) integer tuples where:
 - (0, 0) is the top-left corner.
 - x increases to the right.
 - y increases downward.
+
+Internally, :class:`GameOfLife` stores each live cell as the integer key
+``y * width + x`` in a set, alongside a bytearray bitmap of the board and a
+bytearray of neighbor counts.
+
+:class:`GameOfLife` is the reference implementation and only needs the standard
+library. :class:`DenseGameOfLife` stores the board as a NumPy array and advances
+it with vectorized neighbor sums. :class:`BitPackedGameOfLife` packs 64 cells into
+each ``uint64`` word and counts neighbors with bitwise full adders. Both require
+NumPy to be installed. When the ``_life_kernel`` Cython extension is built or Numba
+is available, :class:`DenseGameOfLife` runs its stencil in a compiled, multi-threaded
+kernel. With CuPy, :class:`BitPackedGameOfLife` can keep the board on a CUDA device
+(``backend="cuda"``).
 """
 
+import multiprocessing
+import os
+import struct
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from multiprocessing.shared_memory import SharedMemory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+try:
+    from _life_kernel import step_kernel as _cython_step_kernel
+except ImportError:
+    _cython_step_kernel = None
+
+try:
+    from gol_kernel import step_kernel as _aot_step_kernel
+except ImportError:
+    _aot_step_kernel = None
+
+# The eight (dx, dy) steps from a cell to its neighbors.
+_NEIGHBOR_OFFSETS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if not (dx == 0 and dy == 0))
+
+# Clearing a board with more than one live cell per this many cells reallocates
+# its buffers instead of zeroing around each live cell from Python: zeroing takes
+# about a microsecond per cell, while allocating costs about that per 50 KB.
+_DENSE_CLEAR_RATIO = 4096
+
+# A new board with at least one live cell per this many cells has its neighbor
+# counts rebuilt for the whole board at once instead of cell by cell.
+_DENSE_COUNT_RATIO = 16
+
+# Maps the 0/1 bytes of a cell bitmap to the digits of a binary literal.
+_BITMAP_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+# 64-bit FNV-1a parameters used by GameOfLife.state_hash.
+_FNV64_OFFSET = 0xCBF29CE484222325
+_FNV64_PRIME = 0x100000001B3
+_MASK64 = (1 << 64) - 1
+
+# Dense stencil tile size: a 256 x 256 block of uint8 cells (64 KB) plus its
+# halo rows fits comfortably in a core's L2 cache.
+_TILE_ROWS = 256
+_TILE_COLS = 256
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _wrap_halo_kernel(grid):
+        """
+        Copies the opposite edges of a padded grid into its halo.
+
+        Rows are copied first so that the column copy also fills the four corners.
+
+        Args:
+            grid (np.ndarray): The padded ``uint8`` grid to update in place.
+        """
+        grid[0, 1:-1] = grid[-2, 1:-1]
+        grid[-1, 1:-1] = grid[1, 1:-1]
+        grid[:, 0] = grid[:, -2]
+        grid[:, -1] = grid[:, 1]
+
+    @njit(cache=True, boundscheck=False)
+    def _step_tile_kernel(grid_in, interior, y0, x0):
+        """
+        Computes the next generation of one tile.
+
+        The tile is indexed through 0-based views so Numba can prove no index is
+        negative and vectorize the inner loop without wraparound checks.
+
+        Args:
+            grid_in (np.ndarray): The current padded ``uint8`` grid, halo filled.
+            interior (np.ndarray): The interior view of the output grid.
+            y0 (int): The first interior row of the tile.
+            x0 (int): The first interior column of the tile.
+        """
+        src = grid_in[y0:y0 + _TILE_ROWS + 2, x0:x0 + _TILE_COLS + 2]
+        dst = interior[y0:y0 + _TILE_ROWS, x0:x0 + _TILE_COLS]
+        tile_rows, tile_cols = dst.shape
+        for y in range(tile_rows):
+            for x in range(tile_cols):
+                n = (src[y, x] + src[y, x + 1] + src[y, x + 2]
+                     + src[y + 1, x] + src[y + 1, x + 2]
+                     + src[y + 2, x] + src[y + 2, x + 1] + src[y + 2, x + 2])
+                dst[y, x] = 1 if n == 3 or (n == 2 and src[y + 1, x + 1] == 1) else 0
+
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _step_kernel(grid_in, grid_out, wrap):
+        """
+        Computes one generation of a padded grid into another padded grid.
+
+        Both buffers carry a one-cell halo. For a toroidal grid the kernel first
+        refreshes the halo of ``grid_in`` from the opposite edges; otherwise the halo
+        is left empty. The interior is cut into L2-sized tiles, and tiles are
+        distributed across threads so each core works on its own block of cells.
+        A board that fits in one tile is computed on the calling thread, skipping
+        the cost of waking the thread pool.
+
+        Args:
+            grid_in (np.ndarray): The current ``uint8`` grid.
+            grid_out (np.ndarray): The ``uint8`` buffer receiving the next generation.
+            wrap (bool): If True, the grid is toroidal.
+        """
+        if wrap:
+            _wrap_halo_kernel(grid_in)
+        interior = grid_out[1:-1, 1:-1]
+        rows, cols = interior.shape
+        tiles_y = (rows + _TILE_ROWS - 1) // _TILE_ROWS
+        tiles_x = (cols + _TILE_COLS - 1) // _TILE_COLS
+        if tiles_y * tiles_x == 1:
+            _step_tile_kernel(grid_in, interior, 0, 0)
+            return
+        for tile in prange(tiles_y * tiles_x):
+            _step_tile_kernel(grid_in, interior, (tile // tiles_x) * _TILE_ROWS, (tile % tiles_x) * _TILE_COLS)
+else:
+    _step_kernel = None
+
+
+def _dense_stencil(padded, out):
+    """
+    Writes the next generation of a padded ``uint8`` grid's interior into ``out``.
+
+    The grid is processed one L2-sized tile at a time. Each tile's neighbor sum is
+    accumulated in place in a single reused buffer, and the rules collapse to one
+    comparison: with ``n`` in 0..8 and the cell in 0..1, ``(n | cell) == 3`` holds
+    exactly when ``n == 3`` or ``n == 2`` and the cell is alive.
+
+    Args:
+        padded (np.ndarray): The grid with a filled one-cell halo.
+        out (np.ndarray): An array shaped like ``padded[1:-1, 1:-1]`` that does not
+            overlap ``padded``.
+    """
+    rows, cols = out.shape
+    buffer = np.empty((min(rows, _TILE_ROWS), min(cols, _TILE_COLS)), dtype=np.uint8)
+    for y0 in range(0, rows, _TILE_ROWS):
+        y1 = min(y0 + _TILE_ROWS, rows)
+        for x0 in range(0, cols, _TILE_COLS):
+            x1 = min(x0 + _TILE_COLS, cols)
+            tile = padded[y0:y1 + 2, x0:x1 + 2]
+            n = buffer[:y1 - y0, :x1 - x0]
+            np.add(tile[:-2, :-2], tile[:-2, 1:-1], out=n)
+            for view in (tile[:-2, 2:], tile[1:-1, :-2], tile[1:-1, 2:], tile[2:, :-2], tile[2:, 1:-1], tile[2:, 2:]):
+                np.add(n, view, out=n)
+            np.bitwise_or(n, tile[1:-1, 1:-1], out=n)
+            np.equal(n, 3, out=out[y0:y1, x0:x1])
+
+
+def _grid_to_bits(grid) -> int:
+    """
+    Packs a ``(height, width)`` 0/1 array into a bit board integer.
+
+    Args:
+        grid (np.ndarray): The cells, one per element.
+
+    Returns:
+        int: An integer with bit ``y * width + x`` set for every live cell.
+    """
+    return int.from_bytes(np.packbits(grid, axis=None, bitorder="little").tobytes(), "little")
+
+
+# Shared-memory grids attached by this worker process, keyed by block name.
+_worker_grids: dict[str, tuple] = {}
+
+
+def _attach_grid(name: str, shape: tuple[int, int]):
+    """
+    Maps a shared-memory block as a ``uint8`` grid, reusing earlier attachments.
+
+    Args:
+        name (str): The shared-memory block name.
+        shape (tuple[int, int]): The padded grid shape.
+
+    Returns:
+        np.ndarray: The grid backed by the shared block.
+    """
+    if name not in _worker_grids:
+        block = SharedMemory(name=name)
+        _worker_grids[name] = (block, np.ndarray(shape, dtype=np.uint8, buffer=block.buf))
+    return _worker_grids[name][1]
+
+
+def _step_band(in_name: str, out_name: str, shape: tuple[int, int], y0: int, y1: int):
+    """
+    Computes padded rows ``[y0, y1)`` of the next generation in a worker process.
+
+    Args:
+        in_name (str): The shared block holding the current padded grid, halo filled.
+        out_name (str): The shared block receiving the next generation.
+        shape (tuple[int, int]): The padded grid shape.
+        y0 (int): The first padded row of the band (at least 1).
+        y1 (int): One past the last padded row of the band.
+    """
+    grid_in = _attach_grid(in_name, shape)
+    grid_out = _attach_grid(out_name, shape)
+    _dense_stencil(grid_in[y0 - 1:y1 + 1], grid_out[y0:y1, 1:-1])
+
+
+def _release_shared(pool: ProcessPoolExecutor, blocks: list[SharedMemory]):
+    """
+    Shuts down a ``step_parallel`` worker pool and unlinks its shared blocks.
+
+    Registered with :func:`weakref.finalize`, so it must not reference the game.
+
+    Args:
+        pool (ProcessPoolExecutor): The worker pool.
+        blocks (list[SharedMemory]): The two shared blocks holding the padded grids.
+    """
+    pool.shutdown()
+    for block in blocks:
+        block.unlink()
+        try:
+            block.close()
+        except BufferError:
+            # Still viewed by a live grid (interpreter exit); the mapping goes with the process.
+            pass
+
+
 class GameOfLife:
     """
     A class to simulate Conway's Game of Life.
 
+    Internally each live cell is stored as the single integer key ``y * width + x``,
+    which is cheaper to hash than a tuple and lets neighbors of interior cells be
+    reached by adding a constant offset. A ``bytearray`` with one byte per cell mirrors
+    the live set, so membership tests are plain byte loads.
+
+    Neighbor counts are kept between generations in a second ``bytearray`` and only
+    updated around cells that change state. Each step re-examines just the cells that
+    changed in the previous generation and their neighbors, so still lifes and other
+    quiet regions cost nothing.
+
     Attributes:
         width (int): The width of the grid (number of columns).
         height (int): The height of the grid (number of rows).
         wrap (bool): If True, the grid is toroidal (edges wrap around).
-        live_cells (set[tuple[int, int]]): A set of tuples representing live cell coordinates.
+        live_cells (set[tuple[int, int]]): A set of tuples representing live cell coordinates,
+            converted from the integer keys on access.
     """
 
     def __init__(self, width: int, height: int, wrap: bool = True):
@@ -42,8 +295,218 @@ class GameOfLife:
             raise TypeError("wrap must be a boolean.")
         self.width = width
         self.height = height
-        self.live_cells: set[tuple[int, int]] = set()
         self.wrap = wrap
+        self._live_snapshot: frozenset[tuple[int, int]] | None = None
+        self._build_wrap_tables()
+        self._allocate()
+
+    def _allocate(self):
+        """
+        Creates the empty board storage.
+
+        Subclasses that keep the board in another representation override this.
+        ``_edge[key]`` is 1 for the cells on the border, whose neighbors are not all at
+        the fixed ``_key_offsets``; it lives here so those subclasses do not pay for it.
+        """
+        w = self.width
+        h = self.height
+        self._live: set[int] = set()
+        self._bitmap = bytearray(w * h)
+        self._counts = bytearray(w * h)
+        self._active: set[int] = set()
+        edge = bytearray(w * h)
+        edge[:w] = edge[-w:] = b"\x01" * w
+        edge[::w] = edge[w - 1::w] = b"\x01" * h
+        self._edge = edge
+
+    def _build_wrap_tables(self):
+        """
+        Precomputes the coordinate lookups used by the neighbor loops.
+
+        ``_wrap_x[x + 1]`` is ``x % width`` for every x in ``[-1, width]`` (and likewise
+        for ``_wrap_y``), so the hot loops index a tuple instead of doing a modulo.
+        ``_key_offsets`` holds the eight key deltas from a cell to its neighbors, valid
+        for cells that are not on an edge. Must be called again if width or height change.
+        """
+        w = self.width
+        self._wrap_x = tuple((i - 1) % w for i in range(w + 2))
+        self._wrap_y = tuple((i - 1) % self.height for i in range(self.height + 2))
+        self._key_offsets = tuple(dy * w + dx for dx, dy in _NEIGHBOR_OFFSETS)
+
+    @property
+    def live_cells(self) -> set[tuple[int, int]]:
+        """
+        set[tuple[int, int]]: The live cell coordinates, decoded from the integer keys.
+        """
+        w = self.width
+        return {(k % w, k // w) for k in self._live}
+
+    @live_cells.setter
+    def live_cells(self, cells: set[tuple[int, int]]):
+        self._replace_live(self._cell_keys(cells))
+
+    def _cell_keys(self, cells: set[tuple[int, int]]) -> set[int]:
+        """
+        Normalizes (x, y) cells as :meth:`set_state` does and encodes them as keys.
+
+        Every :attr:`live_cells` setter goes through this, so assigning cells outside
+        the grid wraps them on a torus and drops them on a bounded grid.
+
+        Args:
+            cells (set[tuple[int, int]]): The live cells, as (x, y) integer pairs.
+
+        Returns:
+            set[int]: The keys ``y * width + x`` of the cells on the grid.
+        """
+        w = self.width
+        h = self.height
+        if self.wrap:
+            return {(y % h) * w + x % w for x, y in cells}
+        return {y * w + x for x, y in cells if 0 <= x < w and 0 <= y < h}
+
+    def _replace_live(self, live: set[int]):
+        """
+        Swaps in a new set of live keys and rebuilds the bitmap and neighbor counts.
+
+        A sparse previous board is cleared by zeroing only the bytes around its live
+        cells; a dense one is cleared by allocating fresh zeroed buffers, a single
+        ``memset`` that is cheaper than visiting every neighbor from Python. Every
+        new live cell and its neighbors are marked for examination by the next step.
+
+        Keeping counts incrementally means the neighbor walk happens here rather than
+        in the first :meth:`step`. A sparse new board is walked cell by cell, with
+        interior cells using the fixed key offsets directly. A dense one is counted for
+        the whole board at once by :meth:`_count_all_neighbors`, a few tens of nanoseconds
+        per board cell instead of about a microsecond per live cell.
+
+        Args:
+            live (set[int]): The new live cell keys.
+        """
+        neighbor_keys = self._neighbor_keys_wrap if self.wrap else self._neighbor_keys_bounded
+        if len(self._live) * _DENSE_CLEAR_RATIO >= len(self._bitmap):
+            self._bitmap = bytearray(len(self._bitmap))
+            self._counts = bytearray(len(self._counts))
+        else:
+            bitmap = self._bitmap
+            counts = self._counts
+            for key in self._live:
+                bitmap[key] = 0
+                for neighbor in neighbor_keys(key):
+                    counts[neighbor] = 0
+        bitmap = self._bitmap
+        if len(live) * _DENSE_COUNT_RATIO >= len(bitmap):
+            for key in live:
+                bitmap[key] = 1
+            self._counts = counts = self._count_all_neighbors()
+            # The cells with a live neighbor are exactly those with a non-zero count.
+            active = set(compress(range(len(counts)), counts))
+            active.update(live)
+        else:
+            counts = self._counts
+            edge = self._edge
+            offsets = self._key_offsets
+            active = set(live)
+            for key in live:
+                bitmap[key] = 1
+                neighbors = neighbor_keys(key) if edge[key] else [key + offset for offset in offsets]
+                for neighbor in neighbors:
+                    counts[neighbor] += 1
+                active.update(neighbors)
+        self._live = live
+        self._active = active
+        self._live_snapshot = None
+
+    def _count_all_neighbors(self) -> bytearray:
+        """
+        Counts the live neighbors of every cell from the bitmap in one pass.
+
+        The bitmap, with a one-cell halo around it (copied from the opposite edges on a
+        torus, empty otherwise), is read as one Python integer with a base-256 digit
+        per cell. Adding the eight copies of that integer shifted by the neighbor
+        offsets sums every cell's neighbors digit-wise; a count never exceeds 8, so no
+        digit carries into the next.
+
+        Returns:
+            bytearray: The neighbor count of each cell, indexed by key.
+        """
+        w = self.width
+        h = self.height
+        bitmap = self._bitmap
+        rows = [bitmap[y * w:(y + 1) * w] for y in range(h)]
+        if self.wrap:
+            rows = [row[-1:] + row + row[:1] for row in rows]
+            rows = [rows[-1], *rows, rows[0]]
+        else:
+            rows = [b"\x00" + row + b"\x00" for row in rows]
+            rows = [bytes(w + 2), *rows, bytes(w + 2)]
+        padded = b"".join(rows)
+        pad_w = w + 2
+        cells = int.from_bytes(padded, "little")
+        sums = 0
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            offset = dy * pad_w + dx
+            sums += cells >> (8 * offset) if offset > 0 else cells << (-8 * offset)
+        digits = sums.to_bytes(len(padded) + pad_w + 1, "little")
+        return bytearray(b"".join(digits[y * pad_w + 1:y * pad_w + 1 + w] for y in range(1, h + 1)))
+
+    def _neighbor_keys(self, key: int) -> list[int]:
+        """
+        Lists the keys of a cell's neighbors under the grid's edge mode.
+
+        The hot loops pick :meth:`_neighbor_keys_wrap` or :meth:`_neighbor_keys_bounded`
+        once into a local instead; neither is stored on the instance, where the bound
+        method would form a reference cycle that keeps the game alive after ``del``.
+
+        Args:
+            key (int): The cell key.
+
+        Returns:
+            list[int]: The neighbor keys.
+        """
+        if self.wrap:
+            return self._neighbor_keys_wrap(key)
+        return self._neighbor_keys_bounded(key)
+
+    def _neighbor_keys_wrap(self, key: int) -> list[int]:
+        """
+        Lists the keys of a cell's eight neighbors on a toroidal grid.
+
+        Args:
+            key (int): The cell key.
+
+        Returns:
+            list[int]: The neighbor keys.
+        """
+        w = self.width
+        y, x = divmod(key, w)
+        if 0 < x < w - 1 and 0 < y < self.height - 1:
+            return [key + offset for offset in self._key_offsets]
+        wrap_x = self._wrap_x
+        wrap_y = self._wrap_y
+        return [wrap_y[y + dy + 1] * w + wrap_x[x + dx + 1] for dx, dy in _NEIGHBOR_OFFSETS]
+
+    def _neighbor_keys_bounded(self, key: int) -> list[int]:
+        """
+        Lists the keys of a cell's neighbors on a bounded grid; cells past the edges are skipped.
+
+        Args:
+            key (int): The cell key.
+
+        Returns:
+            list[int]: The neighbor keys.
+        """
+        w = self.width
+        h = self.height
+        y, x = divmod(key, w)
+        if 0 < x < w - 1 and 0 < y < h - 1:
+            return [key + offset for offset in self._key_offsets]
+        keys = []
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            nx = x + dx
+            ny = y + dy
+            if 0 <= nx < w and 0 <= ny < h:
+                keys.append(ny * w + nx)
+        return keys
 
     def set_state(self, initial_live_cells: set[tuple[int, int]]):
         """
@@ -59,33 +522,223 @@ class GameOfLife:
             - If wrap=True: Out-of-bounds coordinates are normalized modulo width/height.
             - If wrap=False: Out-of-bounds coordinates are ignored.
         """
-        normalized = set()
-        for item in initial_live_cells:
-            if not (isinstance(item, tuple) and len(item) == 2 and all(isinstance(v, int) for v in item)):
+        # Materialized once, so a generator is not used up by the validation pass.
+        cells = list(initial_live_cells)
+        for item in cells:
+            if not (isinstance(item, tuple) and len(item) == 2 and isinstance(item[0], int) and isinstance(item[1], int)):
                 raise ValueError("Each live cell must be a tuple of two integers: (x, y).")
-            x, y = item
-            if self.wrap:
-                x = x % self.width
-                y = y % self.height
-                normalized.add((x, y))
-            else:
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    normalized.add((x, y))
-        self.live_cells = normalized
+        self.set_state_unchecked(cells)
+
+    def set_state_unchecked(self, initial_live_cells: set[tuple[int, int]]):
+        """
+        Sets the initial state of the grid without validating the entries.
+
+        Coordinates are normalized exactly as in :meth:`set_state`, but the per-item type
+        checks are skipped. Use this only for input already known to contain
+        ``(x, y)`` integer pairs, such as a previous :meth:`get_state` result.
+
+        Args:
+            initial_live_cells (set[tuple[int, int]]): A set of (x, y) tuples representing live cells.
+        """
+        self.live_cells = initial_live_cells
+
+    def set_state_coords(self, coords):
+        """
+        Sets the state of the grid from a NumPy array of coordinates.
+
+        Coordinates are normalized exactly as in :meth:`set_state`, but all at once in
+        NumPy and without building a tuple per cell.
+
+        Args:
+            coords (np.ndarray): An ``(N, 2)`` integer array of ``(x, y)`` rows.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If coords is not an ``(N, 2)`` integer array.
+        """
+        if np is None:
+            raise ImportError("set_state_coords requires NumPy.")
+        coords = np.asarray(coords)
+        if coords.ndim != 2 or coords.shape[1] != 2 or not np.issubdtype(coords.dtype, np.integer):
+            raise ValueError("coords must be an (N, 2) integer array of (x, y) rows.")
+        w = self.width
+        h = self.height
+        xs = coords[:, 0].astype(np.intp)
+        ys = coords[:, 1].astype(np.intp)
+        if self.wrap:
+            xs %= w
+            ys %= h
+        else:
+            inside = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+            xs = xs[inside]
+            ys = ys[inside]
+        self._set_live_keys(set((ys * w + xs).tolist()))
+
+    def clear(self):
+        """
+        Kills every cell, keeping the grid's size and edge mode.
 
-    def get_state(self) -> set[tuple[int, int]]:
+        Equivalent to ``set_state(set())`` without the validation pass; the board
+        storage is reused where the implementation allows it.
+        """
+        self.live_cells = set()
+
+    def get_state(self) -> frozenset[tuple[int, int]]:
         """
         Retrieves the current state of the grid.
 
+        The snapshot is built on the first call after the state changes and then
+        returned as-is until the next :meth:`step` or :meth:`set_state`.
+
+        Returns:
+            frozenset[tuple[int, int]]: An immutable snapshot of the live cell coordinates.
+        """
+        if self._live_snapshot is None:
+            self._live_snapshot = frozenset(self.live_cells)
+        return self._live_snapshot
+
+    def set_state_flat(self, keys: set[int]):
+        """
+        Sets the state of the grid from flat cell indices.
+
+        Cell ``(x, y)`` has index ``y * width + x``. This skips building and hashing
+        coordinate tuples.
+
+        Args:
+            keys (set[int]): The indices of the live cells.
+
+        Raises:
+            ValueError: If any index is not an integer in ``[0, width * height)``.
+        """
+        size = self.width * self.height
+        keys = set(keys)
+        for key in keys:
+            if not (isinstance(key, int) and 0 <= key < size):
+                raise ValueError("Each live cell index must be an integer in [0, width * height).")
+        self._set_live_keys(keys)
+
+    def _set_live_keys(self, keys: set[int]):
+        """
+        Replaces the board with validated flat cell indices.
+
+        Args:
+            keys (set[int]): The indices of the live cells.
+        """
+        self._replace_live(keys)
+
+    def get_state_flat(self) -> frozenset[int]:
+        """
+        Retrieves the current state of the grid as flat cell indices.
+
+        Returns:
+            frozenset[int]: The indices ``y * width + x`` of the live cells.
+        """
+        return frozenset(self._live)
+
+    def set_state_bits(self, bits: int):
+        """
+        Sets the state of the grid from a bit board.
+
+        Bit ``y * width + x`` of ``bits`` is cell ``(x, y)``, so a 10x10 board fits in
+        one 100-bit integer.
+
+        Args:
+            bits (int): The bit board.
+
+        Raises:
+            ValueError: If bits is not a non-negative integer below ``2 ** (width * height)``.
+        """
+        if not isinstance(bits, int) or bits < 0 or bits >> (self.width * self.height):
+            raise ValueError("bits must be a non-negative integer below 2 ** (width * height).")
+        digits = format(bits, "b")[::-1].encode("ascii")
+        keys = set()
+        key = digits.find(b"1")
+        while key != -1:
+            keys.add(key)
+            key = digits.find(b"1", key + 1)
+        self._set_live_keys(keys)
+
+    def get_state_bits(self) -> int:
+        """
+        Retrieves the current state of the grid as a bit board.
+
+        Returns:
+            int: An integer with bit ``y * width + x`` set for every live cell ``(x, y)``.
+        """
+        return int(self._bitmap[::-1].translate(_BITMAP_TO_DIGITS), 2)
+
+    def set_state_array(self, cells):
+        """
+        Sets the state of the grid from a NumPy array.
+
+        Element ``[y, x]`` of ``cells`` is cell ``(x, y)``; the NumPy engines copy the
+        array straight into their board without building coordinate tuples.
+
+        Args:
+            cells (np.ndarray): A ``(height, width)`` array of 0/1 (or boolean) cells.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If cells does not have shape ``(height, width)`` or holds values
+                other than 0 and 1.
+        """
+        if np is None:
+            raise ImportError("set_state_array requires NumPy.")
+        cells = np.asarray(cells)
+        if cells.shape != (self.height, self.width):
+            raise ValueError("cells must have shape (height, width).")
+        if cells.dtype != np.bool_ and np.any((cells != 0) & (cells != 1)):
+            raise ValueError("cells must only hold 0 and 1.")
+        self._set_grid(cells.astype(np.uint8, copy=False))
+
+    def _set_grid(self, grid):
+        """
+        Replaces the board with a validated ``(height, width)`` ``uint8`` array.
+
+        Args:
+            grid (np.ndarray): The cells, one per element.
+        """
+        self._set_live_keys(set(np.flatnonzero(grid).tolist()))
+
+    def get_state_array(self):
+        """
+        Retrieves the current state of the grid as a NumPy array.
+
+        Returns:
+            np.ndarray: A new ``(height, width)`` ``uint8`` array with element ``[y, x]``
+            set to 1 for every live cell ``(x, y)``.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("get_state_array requires NumPy.")
+        return np.frombuffer(self._bitmap, dtype=np.uint8).reshape(self.height, self.width).copy()
+
+    def state_hash(self) -> int:
+        """
+        Computes a fixed 64-bit hash of the current state.
+
+        The bit board from :meth:`get_state_bits` is folded 64 bits at a time with
+        FNV-1a, so the value is the same on every platform, Python version and
+        implementation, and can be stored as a literal. Equal states on grids of the
+        same size hash equally.
+
         Returns:
-            set[tuple[int, int]]: A defensive copy of the set of live cell coordinates.
+            int: The hash, in ``[0, 2 ** 64)``.
         """
-        return self.live_cells.copy()
+        n_words = (self.width * self.height + 63) // 64
+        h = _FNV64_OFFSET
+        for (word,) in struct.iter_unpack("<Q", self.get_state_bits().to_bytes(n_words * 8, "little")):
+            h = ((h ^ word) * _FNV64_PRIME) & _MASK64
+        return h
 
     def _get_neighbors_count(self, x: int, y: int) -> int:
         """
         Counts the number of live neighbors for a given cell.
 
+        The count is read from the neighbor counts maintained across generations.
+
         Args:
             x (int): The x-coordinate of the cell.
             y (int): The y-coordinate of the cell.
@@ -93,22 +746,7 @@ class GameOfLife:
         Returns:
             int: The number of live neighbors (0-8).
         """
-        count = 0
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                if self.wrap:
-                    nx = (x + dx + self.width) % self.width
-                    ny = (y + dy + self.height) % self.height
-                else:
-                    nx = x + dx
-                    ny = y + dy
-                    if nx < 0 or nx >= self.width or ny < 0 or ny >= self.height:
-                        continue
-                if (nx, ny) in self.live_cells:
-                    count += 1
-        return count
+        return self._counts[y * self.width + x]
 
     def step(self):
         """
@@ -118,30 +756,796 @@ class GameOfLife:
             1. Survival: A live cell with 2 or 3 neighbors survives.
             2. Birth: A dead cell with exactly 3 neighbors becomes a live cell.
             3. Death: All other live cells die (from loneliness or overpopulation).
+
+        Only cells that changed in the previous generation, or whose neighbor count
+        changed, can change now. Those are checked against the stored counts first;
+        then each birth and death adjusts the counts of its neighbors and marks them
+        for the next generation. A generation without births or deaths leaves nothing
+        marked, so later steps return at once and :meth:`get_state` keeps returning
+        the same snapshot.
+        """
+        if not self._active:
+            return
+        bitmap = self._bitmap
+        counts = self._counts
+        births = []
+        deaths = []
+        for key in self._active:
+            n = counts[key]
+            if bitmap[key]:
+                if n != 2 and n != 3:
+                    deaths.append(key)
+            elif n == 3:
+                births.append(key)
+        if not births and not deaths:
+            # Nothing changed: the board is a fixed point and the snapshot stays valid.
+            self._active = set()
+            return
+
+        live = self._live
+        neighbor_keys = self._neighbor_keys_wrap if self.wrap else self._neighbor_keys_bounded
+        active = set(births)
+        active.update(deaths)
+        for key in births:
+            bitmap[key] = 1
+            live.add(key)
+            for neighbor in neighbor_keys(key):
+                counts[neighbor] += 1
+                active.add(neighbor)
+        for key in deaths:
+            bitmap[key] = 0
+            live.discard(key)
+            for neighbor in neighbor_keys(key):
+                counts[neighbor] -= 1
+                active.add(neighbor)
+        self._active = active
+        self._live_snapshot = None
+
+    def run(self, generations: int):
+        """
+        Advances the simulation by several generations.
+
+        Args:
+            generations (int): The number of generations to advance.
+
+        Raises:
+            ValueError: If generations is negative.
+        """
+        if generations < 0:
+            raise ValueError("generations must be non-negative.")
+        step = self.step
+        for _ in range(generations):
+            step()
+
+
+class DenseGameOfLife(GameOfLife):
+    """
+    A Game of Life simulation backed by a dense NumPy grid.
+
+    The board is stored as a ``np.uint8`` array with a one-cell halo on every side,
+    so neighbor counts for the whole board are the sum of eight shifted views of the
+    same buffer. In bounded mode the halo stays empty; in toroidal mode it is refreshed
+    from the opposite edges before each generation.
+
+    If the Cython extension ``_life_kernel`` or the AOT-compiled ``gol_kernel`` is
+    built, or else if Numba is installed, generations are computed by a compiled
+    kernel that double-buffers between two padded grids instead of allocating per step.
+    :meth:`step_parallel` splits the rows into bands computed by worker processes.
+
+    Attributes:
+        width (int): The width of the grid (number of columns).
+        height (int): The height of the grid (number of rows).
+        wrap (bool): If True, the grid is toroidal (edges wrap around).
+        grid (np.ndarray): A ``(height, width)`` view of the board; 1 marks a live cell.
+        live_cells (set[tuple[int, int]]): The live cell coordinates, derived from ``grid``.
+    """
+
+    _kernel = staticmethod(_cython_step_kernel or _aot_step_kernel or _step_kernel)
+
+    def __init__(self, width: int, height: int, wrap: bool = True):
+        """
+        Initializes a new dense Game of Life grid.
+
+        Args:
+            width (int): Positive integer representing the grid width.
+            height (int): Positive integer representing the grid height.
+            wrap (bool): If True, the grid is toroidal; otherwise, it is bounded.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If width or height is less than or equal to 0.
+            TypeError: If wrap is not a boolean.
+        """
+        if np is None:
+            raise ImportError("DenseGameOfLife requires NumPy.")
+        self._pool: ProcessPoolExecutor | None = None
+        self._padded = None
+        super().__init__(width, height, wrap)
+
+    def _allocate(self):
+        """
+        Creates an empty board.
+        """
+        self.live_cells = set()
+
+    @property
+    def live_cells(self) -> set[tuple[int, int]]:
+        """
+        set[tuple[int, int]]: The live cell coordinates, built from the grid on access.
+        """
+        ys, xs = np.nonzero(self.grid)
+        return set(zip(xs.tolist(), ys.tolist()))
+
+    @live_cells.setter
+    def live_cells(self, cells: set[tuple[int, int]]):
+        self._set_live_keys(self._cell_keys(cells))
+
+    def _set_live_keys(self, keys: set[int]):
+        """
+        Replaces the board with validated flat cell indices.
+
+        Args:
+            keys (set[int]): The indices of the live cells.
+        """
+        # Reuse the existing buffers (possibly shared with step_parallel workers).
+        padded = self._padded
+        if padded is None:
+            padded = np.zeros((self.height + 2, self.width + 2), dtype=np.uint8)
+            self._padded = padded
+            self._back = np.zeros_like(padded)
+            self.grid = padded[1:-1, 1:-1]
+        else:
+            padded.fill(0)
+        if keys:
+            ys, xs = np.divmod(np.fromiter(keys, dtype=np.intp, count=len(keys)), self.width)
+            padded[ys + 1, xs + 1] = 1
+        self._live_snapshot = None
+
+    def get_state_flat(self) -> frozenset[int]:
+        """
+        Retrieves the current state of the grid as flat cell indices.
+
+        Returns:
+            frozenset[int]: The indices ``y * width + x`` of the live cells.
+        """
+        return frozenset(np.flatnonzero(self.grid).tolist())
+
+    def get_state_bits(self) -> int:
+        """
+        Retrieves the current state of the grid as a bit board.
+
+        Returns:
+            int: An integer with bit ``y * width + x`` set for every live cell ``(x, y)``.
+        """
+        return _grid_to_bits(self.grid)
+
+    def _set_grid(self, grid):
+        """
+        Replaces the board with a validated ``(height, width)`` ``uint8`` array.
+
+        Args:
+            grid (np.ndarray): The cells, one per element.
+        """
+        self.live_cells = set()
+        self.grid[...] = grid
+
+    def get_state_array(self):
+        """
+        Retrieves the current state of the grid as a NumPy array.
+
+        Returns:
+            np.ndarray: A copy of the ``(height, width)`` ``uint8`` grid.
+        """
+        return self.grid.copy()
+
+    def _fill_halo(self):
+        """
+        Copies the opposite edges into the halo so that shifted views wrap around.
+
+        Rows are copied first so that the column copy also fills the four corners.
+        """
+        padded = self._padded
+        padded[0, 1:-1] = padded[-2, 1:-1]
+        padded[-1, 1:-1] = padded[1, 1:-1]
+        padded[:, 0] = padded[:, -2]
+        padded[:, -1] = padded[:, 1]
+
+    def _get_neighbors_count(self, x: int, y: int) -> int:
+        """
+        Counts the number of live neighbors for a given cell.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+
+        Returns:
+            int: The number of live neighbors (0-8).
+        """
+        if self.wrap:
+            self._fill_halo()
+        window = self._padded[y:y + 3, x:x + 3]
+        return int(window.sum()) - int(self.grid[y, x])
+
+    def step(self):
+        """
+        Advances the simulation by one generation.
+
+        Neighbor counts are computed tile by tile as the sum of the eight shifted
+        views of the padded grid, and the rules reduce to a single ``(n | cell) == 3``
+        comparison written straight into the back buffer. A compiled kernel (Cython or
+        Numba) does the same per cell and refreshes the wrap halo itself. Either way
+        the next generation is written into the back buffer and the buffers swap.
+        """
+        self._live_snapshot = None
+        if self._kernel is not None:
+            self._kernel(self._padded, self._back, self.wrap)
+        else:
+            if self.wrap:
+                self._fill_halo()
+            _dense_stencil(self._padded, self._back[1:-1, 1:-1])
+        self._swap_buffers()
+
+    def run(self, generations: int):
+        """
+        Advances the simulation by several generations.
+
+        With a compiled kernel the buffers ping-pong in a tight loop, and the grid
+        view and snapshot are updated once at the end instead of every generation.
+
+        Args:
+            generations (int): The number of generations to advance.
+
+        Raises:
+            ValueError: If generations is negative.
+        """
+        kernel = self._kernel
+        if kernel is None:
+            super().run(generations)
+            return
+        if generations < 0:
+            raise ValueError("generations must be non-negative.")
+        front, back, wrap = self._padded, self._back, self.wrap
+        for _ in range(generations):
+            kernel(front, back, wrap)
+            front, back = back, front
+        self._padded, self._back = front, back
+        self.grid = front[1:-1, 1:-1]
+        self._live_snapshot = None
+
+    def _swap_buffers(self):
+        """
+        Makes the back buffer, which holds the next generation, the current grid.
+        """
+        self._padded, self._back = self._back, self._padded
+        self.grid = self._padded[1:-1, 1:-1]
+
+    def step_parallel(self, n_workers: int | None = None):
+        """
+        Advances the simulation by one generation using several processes.
+
+        The rows are split into ``n_workers`` contiguous bands. Both padded buffers
+        live in shared memory, so workers read their band (plus one halo row on each
+        side) and write their rows of the next generation without copying the grid.
+        The worker pool and shared buffers are created on first use and kept until
+        :meth:`close`. Call :meth:`close` (or use the game as a context manager) when
+        done; otherwise they are released only when the game is garbage-collected or
+        the interpreter exits.
+
+        Args:
+            n_workers (int | None): The number of worker processes; defaults to the CPU count.
+
+        Raises:
+            ValueError: If n_workers is less than 1.
+        """
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers < 1:
+            raise ValueError("n_workers must be at least 1.")
+        self._ensure_shared(n_workers)
+        self._live_snapshot = None
+        if self.wrap:
+            self._fill_halo()
+
+        shape = self._padded.shape
+        in_name, out_name = self._shared_names[id(self._padded)], self._shared_names[id(self._back)]
+        bounds = [1 + self.height * i // n_workers for i in range(n_workers + 1)]
+        futures = [
+            self._pool.submit(_step_band, in_name, out_name, shape, y0, y1)
+            for y0, y1 in zip(bounds, bounds[1:])
+            if y0 < y1
+        ]
+        for future in futures:
+            future.result()
+        self._swap_buffers()
+
+    def _ensure_shared(self, n_workers: int):
+        """
+        Moves both padded buffers into shared memory and starts the worker pool if needed.
+
+        Args:
+            n_workers (int): The number of worker processes the pool should have.
+        """
+        if self._pool is not None and self._pool_size != n_workers:
+            self.close()
+        if self._pool is None:
+            context = multiprocessing.get_context("forkserver" if os.name == "posix" else "spawn")
+            self._pool = ProcessPoolExecutor(max_workers=n_workers, mp_context=context)
+            self._pool_size = n_workers
+            shape = self._padded.shape
+            self._shared_blocks = [SharedMemory(create=True, size=max(1, self._padded.nbytes)) for _ in range(2)]
+            self._shared_grids = [np.ndarray(shape, dtype=np.uint8, buffer=b.buf) for b in self._shared_blocks]
+            self._shared_names = {id(g): b.name for g, b in zip(self._shared_grids, self._shared_blocks)}
+            self._release = weakref.finalize(self, _release_shared, self._pool, self._shared_blocks)
+        if not any(self._padded is g for g in self._shared_grids):
+            front, back = self._shared_grids
+            front[...] = self._padded
+            back[...] = 0
+            self._padded, self._back = front, back
+            self.grid = front[1:-1, 1:-1]
+
+    def close(self):
+        """
+        Shuts down the worker pool and releases the shared buffers used by :meth:`step_parallel`.
+
+        Call this once done with :meth:`step_parallel`; leaving the game with a context
+        manager calls it too. The board is copied back into private memory, so the game
+        remains usable.
+        """
+        if self._pool is None:
+            return
+        self._pool = None
+        self._padded = self._padded.copy()
+        self._back = np.zeros_like(self._padded)
+        self.grid = self._padded[1:-1, 1:-1]
+        self._shared_grids = []
+        self._shared_blocks = []
+        self._release()
+
+    def __enter__(self):
+        """
+        Returns the game, so ``with DenseGameOfLife(...) as game:`` closes it on exit.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Releases the :meth:`step_parallel` resources via :meth:`close`.
+        """
+        self.close()
+
+
+# One CUDA thread per packed word; mirrors BitPackedGameOfLife.step on the device.
+_CUDA_STEP_SOURCE = r"""
+extern "C" {
+
+__device__ __forceinline__ void load_row(
+    const unsigned long long* words, int row, int k, int n_words, int last_bit, int wrap,
+    unsigned long long* west, unsigned long long* center, unsigned long long* east)
+{
+    const unsigned long long* r = words + (long long)row * n_words;
+    unsigned long long c = r[k];
+    unsigned long long left = k > 0 ? r[k - 1] : 0ULL;
+    unsigned long long right = k < n_words - 1 ? r[k + 1] : 0ULL;
+    unsigned long long w = (c << 1) | (left >> 63);
+    unsigned long long e = (c >> 1) | (right << 63);
+    if (wrap && k == 0) {
+        w |= (r[n_words - 1] >> last_bit) & 1ULL;
+    }
+    if (wrap && k == n_words - 1) {
+        e |= (r[0] & 1ULL) << last_bit;
+    }
+    *west = w;
+    *center = c;
+    *east = e;
+}
+
+__device__ __forceinline__ void add3(
+    unsigned long long a, unsigned long long b, unsigned long long c,
+    unsigned long long* sum, unsigned long long* carry)
+{
+    unsigned long long partial = a ^ b;
+    *sum = partial ^ c;
+    *carry = (a & b) | (partial & c);
+}
+
+__global__ void life_step(
+    const unsigned long long* words, unsigned long long* out,
+    int height, int n_words, int last_bit, int wrap, unsigned long long tail_mask)
+{
+    long long i = (long long)blockDim.x * blockIdx.x + threadIdx.x;
+    if (i >= (long long)height * n_words) {
+        return;
+    }
+    int y = (int)(i / n_words);
+    int k = (int)(i % n_words);
+
+    unsigned long long aw = 0, ac = 0, ae = 0, bw = 0, bc = 0, be = 0, mw, mc, me;
+    int above = y - 1;
+    int below = y + 1;
+    if (wrap) {
+        above = (above + height) % height;
+        below = below % height;
+    }
+    if (above >= 0) {
+        load_row(words, above, k, n_words, last_bit, wrap, &aw, &ac, &ae);
+    }
+    if (below < height) {
+        load_row(words, below, k, n_words, last_bit, wrap, &bw, &bc, &be);
+    }
+    load_row(words, y, k, n_words, last_bit, wrap, &mw, &mc, &me);
+
+    unsigned long long sum_a, carry_a, sum_b, carry_b, s0, carry_d, twos, fours_a;
+    add3(aw, ac, ae, &sum_a, &carry_a);
+    add3(bw, bc, be, &sum_b, &carry_b);
+    unsigned long long sum_c = mw ^ me;
+    unsigned long long carry_c = mw & me;
+    add3(sum_a, sum_b, sum_c, &s0, &carry_d);
+    add3(carry_a, carry_b, carry_c, &twos, &fours_a);
+    unsigned long long s1 = twos ^ carry_d;
+    unsigned long long fours_b = twos & carry_d;
+    unsigned long long s2 = fours_a ^ fours_b;
+    unsigned long long s3 = fours_a & fours_b;
+
+    unsigned long long next = ~s3 & ~s2 & s1 & (s0 | mc);
+    if (k == n_words - 1) {
+        next &= tail_mask;
+    }
+    out[i] = next;
+}
+
+}
+"""
+
+_cuda_step_kernel = None
+
+
+def _get_cuda_step_kernel():
+    """
+    Compiles the CUDA step kernel on first use.
+
+    Returns:
+        cupy.RawKernel: The compiled ``life_step`` kernel.
+    """
+    global _cuda_step_kernel
+    if _cuda_step_kernel is None:
+        _cuda_step_kernel = cupy.RawKernel(_CUDA_STEP_SOURCE, "life_step")
+    return _cuda_step_kernel
+
+
+def _add3(a, b, c):
+    """
+    Adds three bit-planes lane by lane.
+
+    Args:
+        a, b, c: Integers or integer arrays whose bits are independent one-bit lanes.
+
+    Returns:
+        tuple: The ``(sum, carry)`` bit-planes of ``a + b + c`` for every lane.
+    """
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+class BitPackedGameOfLife(GameOfLife):
+    """
+    A Game of Life simulation on a bit-packed grid.
+
+    Each row is stored as ``ceil(width / 64)`` ``uint64`` words, with cell ``x`` held in
+    bit ``x % 64`` of word ``x // 64``. A generation is computed for 64 cells per word at
+    once: the eight neighbor planes are built by shifting whole rows, summed with a tree
+    of bitwise full adders into four count bit-planes, and combined with the rules
+    without any per-cell branching.
+
+    With ``backend="cuda"`` the words live in a CuPy array on the GPU and each
+    generation runs as a CUDA kernel with one thread per word.
+
+    Attributes:
+        width (int): The width of the grid (number of columns).
+        height (int): The height of the grid (number of rows).
+        wrap (bool): If True, the grid is toroidal (edges wrap around).
+        backend (str): ``"numpy"`` to step on the CPU, ``"cuda"`` to step on the GPU.
+        words (np.ndarray | cupy.ndarray): A ``(height, ceil(width / 64))`` ``uint64`` array
+            holding the board.
+        live_cells (set[tuple[int, int]]): The live cell coordinates, derived from ``words``.
+    """
+
+    def __init__(self, width: int, height: int, wrap: bool = True, backend: str = "numpy"):
+        """
+        Initializes a new bit-packed Game of Life grid.
+
+        Args:
+            width (int): Positive integer representing the grid width.
+            height (int): Positive integer representing the grid height.
+            wrap (bool): If True, the grid is toroidal; otherwise, it is bounded.
+            backend (str): ``"numpy"`` (default) or ``"cuda"``.
+
+        Raises:
+            ImportError: If NumPy is not installed, or CuPy is not installed for the CUDA backend.
+            ValueError: If width or height is less than or equal to 0, or the backend is unknown.
+            TypeError: If wrap is not a boolean.
+        """
+        if np is None:
+            raise ImportError("BitPackedGameOfLife requires NumPy.")
+        if backend not in ("numpy", "cuda"):
+            raise ValueError("backend must be 'numpy' or 'cuda'.")
+        if backend == "cuda" and cupy is None:
+            raise ImportError("The CUDA backend requires CuPy.")
+        self.backend = backend
+        if width > 0:
+            n_words = (width + 63) // 64
+            tail = width % 64
+            self._mask = np.full(n_words, np.iinfo(np.uint64).max, dtype=np.uint64)
+            if tail:
+                self._mask[-1] = (1 << tail) - 1
+            self._last_bit = (width - 1) % 64
+        # The words last found to be a fixed point; any new state is a new array.
+        self._still = None
+        super().__init__(width, height, wrap)
+
+    def _allocate(self):
+        """
+        Creates an empty board.
+        """
+        self.live_cells = set()
+
+    def _pack(self, cells_2d):
+        """
+        Packs a dense board into words, eight cells per byte.
+
+        Args:
+            cells_2d (np.ndarray): A ``(height, width)`` array of 0/1 cells.
+
+        Returns:
+            np.ndarray: The ``(height, ceil(width / 64))`` ``uint64`` words.
+        """
+        padded = np.zeros((self.height, len(self._mask) * 64), dtype=np.uint8)
+        padded[:, :self.width] = cells_2d
+        bits = np.packbits(padded, axis=1, bitorder="little")
+        return bits.view("<u8").astype(np.uint64, copy=False)
+
+    def _unpack(self, words):
+        """
+        Unpacks words into a dense board.
+
+        Args:
+            words (np.ndarray): The ``(height, ceil(width / 64))`` ``uint64`` words.
+
+        Returns:
+            np.ndarray: A ``(height, width)`` ``uint8`` array of 0/1 cells.
+        """
+        bits = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+        return np.unpackbits(bits, axis=1, count=self.width, bitorder="little")
+
+    @property
+    def live_cells(self) -> set[tuple[int, int]]:
+        """
+        set[tuple[int, int]]: The live cell coordinates, unpacked from the words on access.
+        """
+        words = cupy.asnumpy(self.words) if self.backend == "cuda" else self.words
+        ys, xs = np.nonzero(self._unpack(words))
+        return set(zip(xs.tolist(), ys.tolist()))
+
+    @live_cells.setter
+    def live_cells(self, cells: set[tuple[int, int]]):
+        self._set_live_keys(self._cell_keys(cells))
+
+    def clear(self):
+        """
+        Kills every cell, keeping the grid's size and edge mode.
+
+        The words are replaced by a zeroed array of the same shape, skipping the
+        unpacked board that :attr:`live_cells` would build and pack.
+        """
+        self.words = (cupy if self.backend == "cuda" else np).zeros_like(self.words)
+        self._live_snapshot = None
+
+    def _set_live_keys(self, keys: set[int]):
+        """
+        Replaces the board with validated flat cell indices.
+
+        Args:
+            keys (set[int]): The indices of the live cells.
+        """
+        grid = np.zeros(self.width * self.height, dtype=np.uint8)
+        if keys:
+            grid[np.fromiter(keys, dtype=np.intp, count=len(keys))] = 1
+        words = self._pack(grid.reshape(self.height, self.width))
+        self.words = cupy.asarray(words) if self.backend == "cuda" else words
+        self._live_snapshot = None
+
+    def get_state_flat(self) -> frozenset[int]:
+        """
+        Retrieves the current state of the grid as flat cell indices.
+
+        Returns:
+            frozenset[int]: The indices ``y * width + x`` of the live cells.
+        """
+        words = cupy.asnumpy(self.words) if self.backend == "cuda" else self.words
+        return frozenset(np.flatnonzero(self._unpack(words)).tolist())
+
+    def get_state_bits(self) -> int:
+        """
+        Retrieves the current state of the grid as a bit board.
+
+        Returns:
+            int: An integer with bit ``y * width + x`` set for every live cell ``(x, y)``.
+        """
+        words = cupy.asnumpy(self.words) if self.backend == "cuda" else self.words
+        return _grid_to_bits(self._unpack(words))
+
+    def _set_grid(self, grid):
+        """
+        Replaces the board with a validated ``(height, width)`` ``uint8`` array.
+
+        Args:
+            grid (np.ndarray): The cells, one per element.
+        """
+        words = self._pack(grid)
+        self.words = cupy.asarray(words) if self.backend == "cuda" else words
+        self._live_snapshot = None
+
+    def get_state_array(self):
+        """
+        Retrieves the current state of the grid as a NumPy array.
+
+        Returns:
+            np.ndarray: A new ``(height, width)`` ``uint8`` array of 0/1 cells.
+        """
+        words = cupy.asnumpy(self.words) if self.backend == "cuda" else self.words
+        return self._unpack(words)
+
+    def _is_alive(self, x: int, y: int) -> int:
+        """
+        Reads a single cell from the packed words.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+
+        Returns:
+            int: 1 if the cell is alive, 0 otherwise.
+        """
+        return (int(self.words[y, x >> 6]) >> (x & 63)) & 1
+
+    def _get_neighbors_count(self, x: int, y: int) -> int:
+        """
+        Counts the number of live neighbors for a given cell.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+
+        Returns:
+            int: The number of live neighbors (0-8).
+        """
+        w = self.width
+        return sum(self._is_alive(key % w, key // w) for key in self._neighbor_keys(y * w + x))
+
+    def _shift_rows(self, words, dy: int):
+        """
+        Shifts whole rows vertically so that row ``y`` of the result holds row ``y - dy``.
+
+        Args:
+            words (np.ndarray): The packed rows to shift.
+            dy (int): +1 to bring in the row above, -1 to bring in the row below.
+
+        Returns:
+            np.ndarray: The shifted rows; vacated rows are empty unless the grid wraps.
+        """
+        if self.wrap:
+            if dy > 0:
+                return np.concatenate((words[-1:], words[:-1]))
+            return np.concatenate((words[1:], words[:1]))
+        shifted = np.zeros_like(words)
+        if dy > 0:
+            shifted[1:] = words[:-1]
+        else:
+            shifted[:-1] = words[1:]
+        return shifted
+
+    def _shift_west(self, words):
+        """
+        Moves every cell one column to the right, so bit ``x`` holds cell ``x - 1``.
+
+        Args:
+            words (np.ndarray): The packed rows to shift.
+
+        Returns:
+            np.ndarray: The shifted rows. Padding bits past the last column are not cleared.
+        """
+        if words.shape[1] == 1:
+            # A row fits in one word: a plain shift, or a rotate within the row if it wraps.
+            if self.wrap:
+                return (words << np.uint64(1)) | (words >> np.uint64(self._last_bit))
+            return words << np.uint64(1)
+        shifted = words << np.uint64(1)
+        shifted[:, 1:] |= words[:, :-1] >> np.uint64(63)
+        if self.wrap:
+            shifted[:, 0] |= (words[:, -1] >> np.uint64(self._last_bit)) & np.uint64(1)
+        return shifted
+
+    def _shift_east(self, words):
+        """
+        Moves every cell one column to the left, so bit ``x`` holds cell ``x + 1``.
+
+        Args:
+            words (np.ndarray): The packed rows to shift.
+
+        Returns:
+            np.ndarray: The shifted rows.
+        """
+        if words.shape[1] == 1:
+            if self.wrap:
+                return (words >> np.uint64(1)) | ((words & np.uint64(1)) << np.uint64(self._last_bit))
+            return words >> np.uint64(1)
+        shifted = words >> np.uint64(1)
+        shifted[:, :-1] |= words[:, 1:] << np.uint64(63)
+        if self.wrap:
+            shifted[:, -1] |= (words[:, 0] & np.uint64(1)) << np.uint64(self._last_bit)
+        return shifted
+
+    def step(self):
+        """
+        Advances the simulation by one generation.
+
+        The eight neighbor bit-planes are summed with full adders into the count bits
+        ``s0..s3``. A cell is alive next generation when its count is 3, or when it is 2
+        and the cell is already alive, i.e. ``~s3 & ~s2 & s1 & (s0 | alive)``.
+
+        A generation that reproduces its input marks the words as a fixed point (a
+        still life or an empty board): the snapshot from :meth:`get_state` stays
+        valid, and later steps return at once until the state is replaced.
+        """
+        if self.words is self._still:
+            return
+        if self.backend == "cuda":
+            alive = self.words
+            words = self._step_cuda(alive)
+            if bool(cupy.array_equal(words, alive)):
+                self._still = alive
+                return
+            self.words = words
+            self._live_snapshot = None
+            return
+        alive = self.words
+        above = self._shift_rows(alive, 1)
+        below = self._shift_rows(alive, -1)
+
+        sum_a, carry_a = _add3(self._shift_west(above), above, self._shift_east(above))
+        sum_b, carry_b = _add3(self._shift_west(below), below, self._shift_east(below))
+        west, east = self._shift_west(alive), self._shift_east(alive)
+        sum_c, carry_c = west ^ east, west & east
+
+        s0, carry_d = _add3(sum_a, sum_b, sum_c)
+        twos, fours_a = _add3(carry_a, carry_b, carry_c)
+        s1, fours_b = twos ^ carry_d, twos & carry_d
+        s2, s3 = fours_a ^ fours_b, fours_a & fours_b
+
+        words = ~s3 & ~s2 & s1 & (s0 | alive) & self._mask
+        if np.array_equal(words, alive):
+            self._still = alive
+            return
+        self.words = words
+        self._live_snapshot = None
+
+    def _step_cuda(self, words):
+        """
+        Computes the next generation on the GPU, one thread per word.
+
+        Args:
+            words (cupy.ndarray): The current packed rows.
+
+        Returns:
+            cupy.ndarray: The packed rows of the next generation.
         """
-        next_live_cells = set()
-
-        potential_cells = set(self.live_cells)
-        for x, y in self.live_cells:
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if self.wrap:
-                        nx = (x + dx + self.width) % self.width
-                        ny = (y + dy + self.height) % self.height
-                        potential_cells.add((nx, ny))
-                    else:
-                        nx = x + dx
-                        ny = y + dy
-                        if 0 <= nx < self.width and 0 <= ny < self.height:
-                            potential_cells.add((nx, ny))
-
-        for x, y in potential_cells:
-            count = self._get_neighbors_count(x, y)
-            is_alive = (x, y) in self.live_cells
-
-            if is_alive and (count == 2 or count == 3):
-                next_live_cells.add((x, y))
-            elif not is_alive and count == 3:
-                next_live_cells.add((x, y))
-
-        self.live_cells = next_live_cells
\ No newline at end of file
+        n_words = len(self._mask)
+        total = self.height * n_words
+        threads = 256
+        out = cupy.empty_like(words)
+        _get_cuda_step_kernel()(
+            ((total + threads - 1) // threads,),
+            (threads,),
+            (words, out, np.int32(self.height), np.int32(n_words), np.int32(self._last_bit),
+             np.int32(self.wrap), np.uint64(self._mask[-1])),
+        )
+        return out
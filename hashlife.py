@@ -0,0 +1,391 @@
+"""
+HashLife back-end for Conway's Game of Life.
+
+HashLife stores the world as a quadtree whose nodes are interned, so identical
+regions are shared, and memoizes the evolution of every node. Repetitive and
+periodic patterns can then be advanced by many generations at the cost of a few
+dictionary lookups.
+
+:class:`HashLifeGameOfLife` keeps the finite-grid semantics of
+:class:`game_of_life.GameOfLife`:
+
+- Toroidal (wrap=True): The grid is treated as an infinite periodic tiling. Each jump
+  of ``g`` generations (``g`` a power of two no larger than the grid) evolves the grid
+  surrounded by a ``g``-cell border copied from the opposite edges, which is exact for
+  ``g`` generations.
+- Bounded (wrap=False): Cells outside the grid must stay dead, so the world is clipped
+  back to the grid after every generation.
+
+Quadtree levels: a level-0 node is a single cell and a level-k node covers a
+2^k x 2^k square, split into the nw/ne/sw/se quadrants of level k-1.
+"""
+
+from game_of_life import GameOfLife, _add3
+
+_MASK_64 = (1 << 64) - 1
+_NOT_COLUMN_0 = 0xFEFEFEFEFEFEFEFE
+_NOT_COLUMN_7 = 0x7F7F7F7F7F7F7F7F
+
+# Drop the node and result caches once this many nodes have been interned.
+_MAX_NODES = 1 << 20
+
+
+def _life_8x8(board: int) -> int:
+    """
+    Advances an 8x8 board packed into 64 bits by one generation.
+
+    Cell (x, y) is bit ``y * 8 + x``; cells outside the board count as dead.
+
+    Args:
+        board (int): The packed board.
+
+    Returns:
+        int: The packed board after one generation.
+    """
+    west = (board << 1) & _NOT_COLUMN_0
+    east = (board >> 1) & _NOT_COLUMN_7
+    sum_a, carry_a = _add3((west << 8) & _MASK_64, (board << 8) & _MASK_64, (east << 8) & _MASK_64)
+    sum_b, carry_b = _add3(west >> 8, board >> 8, east >> 8)
+    sum_c, carry_c = west ^ east, west & east
+
+    s0, carry_d = _add3(sum_a, sum_b, sum_c)
+    twos, fours_a = _add3(carry_a, carry_b, carry_c)
+    s1, fours_b = twos ^ carry_d, twos & carry_d
+    s2, s3 = fours_a ^ fours_b, fours_a & fours_b
+    return ~s3 & ~s2 & s1 & (s0 | board) & _MASK_64
+
+
+class _Node:
+    """
+    An interned quadtree node.
+
+    Attributes:
+        nw, ne, sw, se (_Node | None): The quadrants; None for level-0 cells.
+        level (int): The node covers a 2^level x 2^level square.
+        population (int): The number of live cells in the node.
+    """
+
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw, ne, sw, se, level: int, population: int):
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+_DEAD = _Node(None, None, None, None, 0, 0)
+_ALIVE = _Node(None, None, None, None, 0, 1)
+
+
+class HashLifeGameOfLife(GameOfLife):
+    """
+    A Game of Life simulation that advances the grid with the HashLife algorithm.
+
+    The public state is still the set of live cells; the quadtree is built from it for
+    every jump. Node interning and the memoized results persist across jumps, so
+    structure seen before is not recomputed. Use :meth:`advance` to move many
+    generations at once on a toroidal grid.
+
+    Attributes:
+        width (int): The width of the grid (number of columns).
+        height (int): The height of the grid (number of rows).
+        wrap (bool): If True, the grid is toroidal (edges wrap around).
+        live_cells (set[tuple[int, int]]): A set of tuples representing live cell coordinates.
+    """
+
+    def __init__(self, width: int, height: int, wrap: bool = True):
+        """
+        Initializes a new HashLife-backed grid.
+
+        Args:
+            width (int): Positive integer representing the grid width.
+            height (int): Positive integer representing the grid height.
+            wrap (bool): If True, the grid is toroidal; otherwise, it is bounded.
+
+        Raises:
+            ValueError: If width or height is less than or equal to 0.
+            TypeError: If wrap is not a boolean.
+        """
+        super().__init__(width, height, wrap)
+        self._clear_caches()
+
+    def _clear_caches(self):
+        """
+        Resets the intern table, the empty-node cache and the memoized results.
+        """
+        self._nodes: dict[tuple[int, int, int, int], _Node] = {}
+        self._empty: list[_Node] = [_DEAD]
+        self._results: dict[tuple[int, int], _Node] = {}
+
+    def _join(self, nw: _Node, ne: _Node, sw: _Node, se: _Node) -> _Node:
+        """
+        Returns the interned node with the given quadrants.
+
+        Args:
+            nw, ne, sw, se (_Node): Quadrants of equal level.
+
+        Returns:
+            _Node: The canonical node one level above its quadrants.
+        """
+        key = (id(nw), id(ne), id(sw), id(se))
+        node = self._nodes.get(key)
+        if node is None:
+            node = _Node(nw, ne, sw, se, nw.level + 1,
+                         nw.population + ne.population + sw.population + se.population)
+            self._nodes[key] = node
+        return node
+
+    def _empty_node(self, level: int) -> _Node:
+        """
+        Returns the interned empty node of a level.
+
+        Args:
+            level (int): The level of the node.
+
+        Returns:
+            _Node: An empty 2^level x 2^level node.
+        """
+        while len(self._empty) <= level:
+            e = self._empty[-1]
+            self._empty.append(self._join(e, e, e, e))
+        return self._empty[level]
+
+    def _build(self, cells: list[tuple[int, int]], x0: int, y0: int, level: int) -> _Node:
+        """
+        Builds a node from the cells inside a square.
+
+        Args:
+            cells (list[tuple[int, int]]): Live cells, all inside the square.
+            x0 (int): The x-coordinate of the square's top-left corner.
+            y0 (int): The y-coordinate of the square's top-left corner.
+            level (int): The level of the node to build.
+
+        Returns:
+            _Node: The node covering ``[x0, x0 + 2^level) x [y0, y0 + 2^level)``.
+        """
+        if not cells:
+            return self._empty_node(level)
+        if level == 0:
+            return _ALIVE
+        half = 1 << (level - 1)
+        xm, ym = x0 + half, y0 + half
+        quadrants: tuple[list, list, list, list] = ([], [], [], [])
+        for cell in cells:
+            quadrants[(cell[0] >= xm) + 2 * (cell[1] >= ym)].append(cell)
+        return self._join(
+            self._build(quadrants[0], x0, y0, level - 1),
+            self._build(quadrants[1], xm, y0, level - 1),
+            self._build(quadrants[2], x0, ym, level - 1),
+            self._build(quadrants[3], xm, ym, level - 1),
+        )
+
+    def _collect(self, node: _Node, x0: int, y0: int, out: set[tuple[int, int]]):
+        """
+        Adds the live cells of a node that fall inside the grid to a set.
+
+        Args:
+            node (_Node): The node to read.
+            x0 (int): The x-coordinate of the node's top-left corner.
+            y0 (int): The y-coordinate of the node's top-left corner.
+            out (set[tuple[int, int]]): The set receiving the cells.
+        """
+        if node.population == 0 or x0 >= self.width or y0 >= self.height:
+            return
+        if node.level == 0:
+            out.add((x0, y0))
+            return
+        half = 1 << (node.level - 1)
+        self._collect(node.nw, x0, y0, out)
+        self._collect(node.ne, x0 + half, y0, out)
+        self._collect(node.sw, x0, y0 + half, out)
+        self._collect(node.se, x0 + half, y0 + half, out)
+
+    def _to_bits(self, node: _Node, size: int) -> int:
+        """
+        Packs a small node into an integer, cell (x, y) at bit ``y * 8 + x``.
+
+        Args:
+            node (_Node): A node of level 3 or less.
+            size (int): The side length of the node (2^level).
+
+        Returns:
+            int: The packed cells.
+        """
+        if node.population == 0:
+            return 0
+        if size == 1:
+            return 1
+        half = size // 2
+        return (self._to_bits(node.nw, half)
+                | self._to_bits(node.ne, half) << half
+                | self._to_bits(node.sw, half) << (8 * half)
+                | self._to_bits(node.se, half) << (8 * half + half))
+
+    def _from_bits(self, bits: int, x0: int, y0: int, size: int) -> _Node:
+        """
+        Builds a node from a square of a packed 8x8 board.
+
+        Args:
+            bits (int): The packed board, cell (x, y) at bit ``y * 8 + x``.
+            x0 (int): The x-coordinate of the square's top-left corner.
+            y0 (int): The y-coordinate of the square's top-left corner.
+            size (int): The side length of the square (a power of two).
+
+        Returns:
+            _Node: The node holding the square.
+        """
+        if size == 1:
+            return _ALIVE if (bits >> (y0 * 8 + x0)) & 1 else _DEAD
+        half = size // 2
+        return self._join(
+            self._from_bits(bits, x0, y0, half),
+            self._from_bits(bits, x0 + half, y0, half),
+            self._from_bits(bits, x0, y0 + half, half),
+            self._from_bits(bits, x0 + half, y0 + half, half),
+        )
+
+    def _successor(self, node: _Node, j: int) -> _Node:
+        """
+        Returns the centre of a node advanced by up to 2^j generations.
+
+        A level-k node can be advanced by at most 2^(k-2) generations, so ``j`` is
+        clamped to ``node.level - 2``. Results are memoized per ``(node, j)``.
+
+        Args:
+            node (_Node): A node of level 3 or more.
+            j (int): The log2 of the requested number of generations.
+
+        Returns:
+            _Node: The centre of the node, one level down, after ``2^min(j, level - 2)``
+            generations.
+        """
+        if node.population == 0:
+            return node.nw
+        j = min(j, node.level - 2)
+        key = (id(node), j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 3:
+            board = self._to_bits(node, 8)
+            for _ in range(1 << j):
+                board = _life_8x8(board)
+            result = self._from_bits(board, 2, 2, 4)
+        else:
+            join = self._join
+            successor = self._successor
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            c1 = successor(nw, j)
+            c2 = successor(join(nw.ne, ne.nw, nw.se, ne.sw), j)
+            c3 = successor(ne, j)
+            c4 = successor(join(nw.sw, nw.se, sw.nw, sw.ne), j)
+            c5 = successor(join(nw.se, ne.sw, sw.ne, se.nw), j)
+            c6 = successor(join(ne.sw, ne.se, se.nw, se.ne), j)
+            c7 = successor(sw, j)
+            c8 = successor(join(sw.ne, se.nw, sw.se, se.sw), j)
+            c9 = successor(se, j)
+            if j < node.level - 2:
+                # The nine parts are already 2^j generations ahead; stitch their centres.
+                result = join(
+                    join(c1.se, c2.sw, c4.ne, c5.nw),
+                    join(c2.se, c3.sw, c5.ne, c6.nw),
+                    join(c4.se, c5.sw, c7.ne, c8.nw),
+                    join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                # The parts are halfway there; advance each 2x2 group by the other half.
+                result = join(
+                    successor(join(c1, c2, c4, c5), j),
+                    successor(join(c2, c3, c5, c6), j),
+                    successor(join(c4, c5, c7, c8), j),
+                    successor(join(c5, c6, c8, c9), j),
+                )
+        self._results[key] = result
+        return result
+
+    def _jump(self, generations: int) -> set[tuple[int, int]]:
+        """
+        Computes the live cells a power-of-two number of generations ahead.
+
+        Args:
+            generations (int): A power of two; at most ``min(width, height)`` when
+                wrapping and exactly 1 when bounded.
+
+        Returns:
+            set[tuple[int, int]]: The live cells after the jump.
+        """
+        if len(self._nodes) > _MAX_NODES:
+            self._clear_caches()
+        j = generations.bit_length() - 1
+        w = self.width
+        h = self.height
+        # The result (the root's centre) must cover the grid, and the root must reach
+        # `generations` cells past it on every side.
+        level = max(3, (max(w, h) - 1).bit_length() + 1, j + 2)
+        origin = -(1 << (level - 2))
+
+        if self.wrap:
+            g = generations
+            cells = [
+                (x + sx, y + sy)
+                for x, y in self.live_cells
+                for sx in (-w, 0, w)
+                for sy in (-h, 0, h)
+                if -g <= x + sx < w + g and -g <= y + sy < h + g
+            ]
+        else:
+            cells = list(self.live_cells)
+
+        result = self._successor(self._build(cells, origin, origin, level), j)
+        next_live_cells: set[tuple[int, int]] = set()
+        self._collect(result, 0, 0, next_live_cells)
+        return next_live_cells
+
+    def advance(self, generations: int):
+        """
+        Advances the simulation by several generations.
+
+        On a toroidal grid the generations are covered by power-of-two jumps of up to
+        ``min(width, height)`` generations each; a bounded grid is advanced one
+        generation at a time.
+
+        Args:
+            generations (int): The number of generations to advance.
+
+        Raises:
+            ValueError: If generations is negative.
+        """
+        if generations < 0:
+            raise ValueError("generations must be non-negative.")
+        limit = min(self.width, self.height) if self.wrap else 1
+        while generations:
+            jump = 1 << (min(generations, limit).bit_length() - 1)
+            cells = self._jump(jump)
+            # An unchanged board keeps its buffers and get_state() snapshot.
+            if cells != self._live_snapshot:
+                self.live_cells = cells
+            generations -= jump
+
+    def run(self, generations: int):
+        """
+        Advances the simulation by several generations with HashLife jumps.
+
+        Same as :meth:`advance`.
+
+        Args:
+            generations (int): The number of generations to advance.
+
+        Raises:
+            ValueError: If generations is negative.
+        """
+        self.advance(generations)
+
+    def step(self):
+        """
+        Advances the simulation by one generation.
+        """
+        self.advance(1)
@@ -7,8 +7,24 @@ Coordinate system:
 - x increases to the right; y increases downward (like terminal rows).
 """
 
+import functools
+import gc
 import unittest
-from game_of_life import GameOfLife
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from game_of_life import BitPackedGameOfLife, DenseGameOfLife, GameOfLife, _step_kernel
+from hashlife import HashLifeGameOfLife
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import cupy
+    CUDA_AVAILABLE = cupy.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    CUDA_AVAILABLE = False
 
 
 def bounding_box(cells: set[tuple[int, int]]) -> tuple[int, int, int, int] | None:
@@ -22,11 +38,21 @@ def bounding_box(cells: set[tuple[int, int]]) -> tuple[int, int, int, int] | Non
         tuple[int, int, int, int] | None: The bounding box as (min_x, min_y, max_x, max_y),
         or None if the set is empty.
     """
-    if not cells:
+    it = iter(cells)
+    first = next(it, None)
+    if first is None:
         return None
-    xs = [x for x, _ in cells]
-    ys = [y for _, y in cells]
-    return (min(xs), min(ys), max(xs), max(ys))
+    min_x, min_y = max_x, max_y = first
+    for x, y in it:
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+    return (min_x, min_y, max_x, max_y)
 
 def coords(*pairs):
     """
@@ -40,6 +66,63 @@ def coords(*pairs):
     """
     return set(pairs)
 
+def pack(x: int, y: int, width: int = 10) -> int:
+    """
+    Converts a cell coordinate to the flat index used by ``set_state_flat``.
+
+    Args:
+        x (int): The x-coordinate of the cell.
+        y (int): The y-coordinate of the cell.
+        width (int, optional): The grid width. Defaults to 10.
+
+    Returns:
+        int: The index ``y * width + x``.
+    """
+    return y * width + x
+
+def count_neighbors(cells: set[tuple[int, int]], x: int, y: int, width: int, height: int, wrap: bool) -> int:
+    """
+    Counts the live neighbors of a cell directly from a set of cells.
+
+    Args:
+        cells (set[tuple[int, int]]): The live (x, y) cells.
+        x (int): The x-coordinate of the cell.
+        y (int): The y-coordinate of the cell.
+        width (int): The grid width.
+        height (int): The grid height.
+        wrap (bool): If True, neighbors past an edge wrap around to the opposite one.
+
+    Returns:
+        int: The number of live neighbors (0-8).
+    """
+    count = 0
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            if dx or dy:
+                nx, ny = x + dx, y + dy
+                if wrap:
+                    nx, ny = nx % width, ny % height
+                count += (nx, ny) in cells
+    return count
+
+def to_array(cells: set[tuple[int, int]], width: int = 10, height: int = 10):
+    """
+    Builds the NumPy board for a set of cells.
+
+    Args:
+        cells (set[tuple[int, int]]): The live (x, y) cells.
+        width (int, optional): The grid width. Defaults to 10.
+        height (int, optional): The grid height. Defaults to 10.
+
+    Returns:
+        numpy.ndarray: A ``(height, width)`` ``uint8`` array with element ``[y, x]`` set
+        to 1 for every live cell.
+    """
+    board = numpy.zeros((height, width), dtype=numpy.uint8)
+    for x, y in cells:
+        board[y, x] = 1
+    return board
+
 def translate(cells: set[tuple[int, int]], dx: int, dy: int, width: int | None = None, height: int | None = None) -> set[tuple[int, int]]:
     """
     Translates a set of cells by (dx, dy), optionally wrapping coordinates.
@@ -54,93 +137,194 @@ def translate(cells: set[tuple[int, int]], dx: int, dy: int, width: int | None =
     Returns:
         set[tuple[int, int]]: The translated set of (x, y) tuples.
     """
-    result: set[tuple[int, int]] = set()
-    for x, y in cells:
-        nx, ny = x + dx, y + dy
-        if width is not None and height is not None:
-            nx %= width
-            ny %= height
-        result.add((nx, ny))
-    return result
+    if width is not None and height is not None:
+        return {((x + dx) % width, (y + dy) % height) for x, y in cells}
+    return {(x + dx, y + dy) for x, y in cells}
 
-def canonicalize(cells: set[tuple[int, int]]) -> set[tuple[int, int]]:
+def canonicalize(cells: set[tuple[int, int]]) -> frozenset[tuple[int, int]]:
     """
     Normalizes a set of cells so the top-left cell is at (0, 0).
 
+    Results are memoized, so canonicalizing the same shape again (for example the
+    ``get_state()`` snapshot of an oscillator) is a single dictionary lookup.
+
     Args:
         cells (set[tuple[int, int]]): A set of (x, y) tuples representing cell coordinates.
 
     Returns:
-        set[tuple[int, int]]: The normalized set of (x, y) tuples.
+        frozenset[tuple[int, int]]: The normalized set of (x, y) tuples.
+    """
+    return _canonicalize_frozen(frozenset(cells))
+
+@functools.lru_cache(maxsize=256)
+def _canonicalize_frozen(cells: frozenset[tuple[int, int]]) -> frozenset[tuple[int, int]]:
     """
-    if not cells:
-        return set()
-    min_x = min(x for x, _ in cells)
-    min_y = min(y for _, y in cells)
-    return {(x - min_x, y - min_y) for x, y in cells}
+    Normalizes a frozen set of cells; the memoized body of :func:`canonicalize`.
+
+    Args:
+        cells (frozenset[tuple[int, int]]): The cells to normalize.
+
+    Returns:
+        frozenset[tuple[int, int]]: The normalized cells.
+    """
+    box = bounding_box(cells)
+    if box is None:
+        return frozenset()
+    min_x, min_y = box[0], box[1]
+    return frozenset((x - min_x, y - min_y) for x, y in cells)
+
+# Patterns shared by the tests, built once at import. They are frozensets so a
+# test cannot accidentally change them for the tests that run after it.
+BLOCK = frozenset({(1, 1), (1, 2), (2, 1), (2, 2)})
+BLINKER_H = frozenset({(1, 2), (2, 2), (3, 2)})
+BLINKER_V = frozenset({(2, 1), (2, 2), (2, 3)})
+BLINKER_H_WRAP = frozenset({(9, 1), (0, 1), (1, 1)})
+BLINKER_V_WRAP = frozenset({(0, 0), (0, 1), (0, 2)})
+BEEHIVE = frozenset({(2, 1), (3, 1), (1, 2), (4, 2), (2, 3), (3, 3)})
+BOAT = frozenset({(0, 0), (1, 0), (0, 1), (2, 1), (1, 2)})
+TOAD_P1 = frozenset({(2, 1), (3, 1), (4, 1), (1, 2), (2, 2), (3, 2)})
+GLIDER = frozenset({(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)})
+# GLIDER after 4 generations: the same shape moved one cell down and right (dx=dy=1).
+GLIDER_END = frozenset({(2, 1), (3, 2), (1, 3), (2, 3), (3, 3)})
+R_PENTOMINO = frozenset({(1, 0), (2, 0), (0, 1), (1, 1), (1, 2)})
+FULL_10 = frozenset((x, y) for x in range(10) for y in range(10))
+FULL_3 = frozenset((x, y) for x in range(3) for y in range(3))
+CORNERS_3 = frozenset({(0, 0), (2, 0), (0, 2), (2, 2)})
+
+# Single-generation rule checks for cell (5, 5): (description, initial state,
+# whether (5, 5) is alive after one step).
+RULE_CASES = (
+    ("Cell should die from underpopulation.", frozenset({(5, 5), (5, 6)}), False),
+    ("Cell should survive with 2 neighbors.", frozenset({(5, 5), (5, 6), (6, 5)}), True),
+    ("Cell should survive with 3 neighbors.", frozenset({(5, 5), (5, 6), (6, 5), (4, 5)}), True),
+    ("Cell should die from overpopulation.", frozenset({(5, 5), (4, 5), (6, 5), (5, 4), (5, 6)}), False),
+    ("Cell should be born from 3 neighbors.", frozenset({(4, 5), (6, 5), (5, 4)}), True),
+    ("Dead cell with 2 neighbors should stay dead", frozenset({(4, 5), (6, 5)}), False),
+    ("Dead cell with 4 neighbors should stay dead", frozenset({(4, 5), (6, 5), (5, 4), (5, 6)}), False),
+)
+
+# Bit boards of the blinker phases on the 10x10 grid: bit y * 10 + x is cell (x, y).
+BLINKER_H_BITS = 0b111 << 21
+BLINKER_V_BITS = (1 << 12) | (1 << 22) | (1 << 32)
+
+# Flat indices (y * 10 + x) of the blinker phases on the 10x10 grid.
+BLINKER_H_FLAT = frozenset(pack(x, y) for x, y in BLINKER_H)
+BLINKER_V_FLAT = frozenset(pack(x, y) for x, y in BLINKER_V)
+
+# state_hash() of the R-pentomino after two generations on the 10x10 torus.
+R_PENTOMINO_P2_HASH = 0x0E95EDE331D8E316
+
+def setUpModule():
+    """
+    Compiles (or loads from Numba's on-disk cache) the JIT stencil kernel once.
+
+    Without this the first test to step a Numba-backed grid would absorb the
+    compile latency. The reference engine is pure Python and needs no warm-up.
+    """
+    if _step_kernel is not None:
+        grid = numpy.zeros((12, 12), dtype=numpy.uint8)
+        _step_kernel(grid, numpy.zeros_like(grid), True)
+
+class _NumPyDenseGameOfLife(DenseGameOfLife):
+    """DenseGameOfLife with the compiled kernel disabled, forcing the NumPy stencil."""
+
+    _kernel = None
+
+class _NumbaDenseGameOfLife(DenseGameOfLife):
+    """DenseGameOfLife pinned to the Numba kernel, even when the Cython extension is built."""
+
+    _kernel = staticmethod(_step_kernel)
+
+class _CudaBitPackedGameOfLife(BitPackedGameOfLife):
+    """BitPackedGameOfLife pinned to the CUDA backend."""
+
+    def __init__(self, width, height, wrap=True, backend="cuda"):
+        super().__init__(width, height, wrap, backend)
 
 class TestGameOfLife(unittest.TestCase):
     """
     Unit tests for the GameOfLife class.
+
+    Subclasses rerun the whole suite against another implementation by overriding
+    ``game_class``.
     """
 
-    def setUp(self):
-        """
-        Sets up a clean 10x10 grid before each test.
+    game_class = GameOfLife
+    # Whether a step that changes nothing keeps the get_state() snapshot object.
+    keeps_unchanged_snapshot = True
 
-        The grid uses toroidal (wrapping) behavior at the edges.
+    @classmethod
+    def setUpClass(cls):
+        """
+        Creates the 10x10 toroidal grid shared by the tests of this class.
         """
-        self.game = GameOfLife(10, 10, wrap=True)
+        cls._game = cls.game_class(10, 10, wrap=True)
 
-    def test_underpopulation(self):
+    @classmethod
+    def tearDownClass(cls):
         """
-        Tests that a live cell with 1 neighbor dies due to underpopulation.
+        Releases the shared grid, so engines holding large buffers free them per class.
         """
-        self.game.set_state(coords((5, 5), (5, 6)))
-        self.game.step()
-        self.assertNotIn((5, 5), self.game.get_state(), "Cell should die from underpopulation.")
+        del cls._game
 
-    def test_survival_2_neighbors(self):
+    def setUp(self):
         """
-        Tests that a live cell with 2 neighbors survives.
+        Hands each test the shared 10x10 grid, cleared.
+
+        The grid uses toroidal (wrapping) behavior at the edges.
         """
-        self.game.set_state(coords((5, 5), (5, 6), (6, 5)))
-        self.game.step()
-        self.assertIn((5, 5), self.game.get_state(), "Cell should survive with 2 neighbors.")
+        self.game = self._game
+        self.game.clear()
 
-    def test_survival_3_neighbors(self):
+    def _run_one(self, initial_state: set[tuple[int, int]], generations: int = 1) -> frozenset[tuple[int, int]]:
         """
-        Tests that a live cell with 3 neighbors survives.
+        Seeds the shared grid, advances it and returns the resulting state.
+
+        Args:
+            initial_state (set[tuple[int, int]]): The live cells to start from.
+            generations (int, optional): The number of generations to run. Defaults to 1.
+
+        Returns:
+            frozenset[tuple[int, int]]: The state after the given number of generations.
         """
-        self.game.set_state(coords((5, 5), (5, 6), (6, 5), (4, 5)))
-        self.game.step()
-        self.assertIn((5, 5), self.game.get_state(), "Cell should survive with 3 neighbors.")
+        game = self.game
+        game.set_state(initial_state)
+        game.run(generations)
+        return game.get_state()
 
-    def test_overpopulation(self):
+    def _assert_evolves_like_reference(self, game, cells, steps: int, advance=None, generations_per_step: int = 1):
         """
-        Tests that a live cell with more than 3 neighbors dies due to overpopulation.
+        Seeds a game and the set-based engine with the same cells and compares them after every step.
+
+        Args:
+            game (GameOfLife): The game under test; it is re-seeded with ``cells``.
+            cells (set[tuple[int, int]]): The live cells to start from.
+            steps (int): How many times to advance both games.
+            advance (Callable[[GameOfLife], None], optional): Advances ``game`` by one step.
+                Defaults to calling ``game.step()``.
+            generations_per_step (int, optional): The generations one call of ``advance``
+                covers. Defaults to 1.
         """
-        self.game.set_state(coords((5, 5), (4, 5), (6, 5), (5, 4), (5, 6)))
-        self.game.step()
-        self.assertNotIn((5, 5), self.game.get_state(), "Cell should die from overpopulation.")
-
-    def test_reproduction(self):
+        reference = GameOfLife(game.width, game.height, wrap=game.wrap)
+        reference.set_state(cells)
+        game.set_state(cells)
+        for _ in range(steps):
+            for _ in range(generations_per_step):
+                reference.step()
+            if advance is None:
+                game.step()
+            else:
+                advance(game)
+            self.assertEqual(game.get_state(), reference.get_state())
+
+    def test_rules(self):
         """
-        Tests that a dead cell with exactly 3 neighbors becomes alive.
+        Tests each rule on cell (5, 5): underpopulation, survival, overpopulation,
+        reproduction and stasis of a dead cell.
         """
-        self.game.set_state(coords((4, 5), (6, 5), (5, 4)))
-        self.game.step()
-        self.assertIn((5, 5), self.game.get_state(), "Cell should be born from 3 neighbors.")
-
-    def test_stasis_dead_cell(self):
-        """A dead cell (5, 5) with 2 or 4 neighbors should remain dead."""
-        self.game.set_state(coords((4, 5), (6, 5)))
-        self.game.step()
-        self.assertNotIn((5, 5), self.game.get_state(), "Dead cell with 2 neighbors should stay dead")
-
-        self.game.set_state(coords((4, 5), (6, 5), (5, 4), (5, 6)))
-        self.game.step()
-        self.assertNotIn((5, 5), self.game.get_state(), "Dead cell with 4 neighbors should stay dead")
+        for message, initial_state, alive in RULE_CASES:
+            with self.subTest(message):
+                self.assertEqual((5, 5) in self._run_one(initial_state), alive, message)
 
     def test_still_life_block(self):
         """The 'Block' pattern should remain stable.
@@ -150,10 +334,7 @@ class TestGameOfLife(unittest.TestCase):
         ##
         Top-left at (1,1)
         """
-        block = coords((1, 1), (1, 2), (2, 1), (2, 2))
-        self.game.set_state(block)
-        self.game.step()
-        self.assertEqual(self.game.get_state(), block)
+        self.assertEqual(self._run_one(BLOCK), BLOCK)
 
     def test_still_life_beehive(self):
         """The 'Beehive' pattern should remain stable.
@@ -164,10 +345,7 @@ class TestGameOfLife(unittest.TestCase):
         .##.
         Centered around (2,2), (3, 2)
         """
-        beehive = coords((2, 1), (3, 1), (1, 2), (4, 2), (2, 3), (3, 3))
-        self.game.set_state(beehive)
-        self.game.step()
-        self.assertEqual(self.game.get_state(), beehive)
+        self.assertEqual(self._run_one(BEEHIVE), BEEHIVE)
 
     def test_still_life_boat(self):
         """The 'Boat' pattern should remain stable.
@@ -178,10 +356,7 @@ class TestGameOfLife(unittest.TestCase):
         .#.
         Top-left at (0,0)
         """
-        boat = coords((0, 0), (1, 0), (0, 1), (2, 1), (1, 2))
-        self.game.set_state(boat)
-        self.game.step()
-        self.assertEqual(self.game.get_state(), boat)
+        self.assertEqual(self._run_one(BOAT), BOAT)
 
     def test_oscillator_blinker_period_1(self):
         """The 'Blinker' should change orientation after 1 step.
@@ -194,19 +369,11 @@ class TestGameOfLife(unittest.TestCase):
         ..#..
         ..#..
         """
-        blinker_h = coords((1, 2), (2, 2), (3, 2))
-        blinker_v = coords((2, 1), (2, 2), (2, 3))
-        self.game.set_state(blinker_h)
-        self.game.step()
-        self.assertEqual(self.game.get_state(), blinker_v)
+        self.assertEqual(self._run_one(BLINKER_H), BLINKER_V)
 
     def test_oscillator_blinker_period_2(self):
         """The 'Blinker' should return to its initial state after 2 steps."""
-        blinker_h = coords((1, 2), (2, 2), (3, 2))
-        self.game.set_state(blinker_h)
-        self.game.step()
-        self.game.step()
-        self.assertEqual(self.game.get_state(), blinker_h)
+        self.assertEqual(self._run_one(BLINKER_H, 2), BLINKER_H)
 
     def test_oscillator_toad_period_1(self):
         """The 'Toad' should transition to phase 2 after 1 step.
@@ -223,49 +390,32 @@ class TestGameOfLife(unittest.TestCase):
         .#..#.
         ..#...
         """
-        toad_p1 = coords((2, 1), (3, 1), (4, 1), (1, 2), (2, 2), (3, 2))
-        self.game.set_state(toad_p1)
-        self.game.step()
-        s1 = self.game.get_state()
-        self.assertNotEqual(s1, toad_p1, "Toad should change phase after 1 step")
-        self.assertEqual(len(s1), len(toad_p1), "Population should stay constant for toad")
+        s1 = self._run_one(TOAD_P1)
+        self.assertNotEqual(s1, TOAD_P1, "Toad should change phase after 1 step")
+        self.assertEqual(len(s1), len(TOAD_P1), "Population should stay constant for toad")
 
     def test_oscillator_toad_period_2(self):
         """The 'Toad' returns to its initial state after 2 steps (period-2)."""
-        toad_p1 = coords((2, 1), (3, 1), (4, 1), (1, 2), (2, 2), (3, 2))
-        self.game.set_state(toad_p1)
-        self.game.step()
-        self.game.step()
-        self.assertEqual(self.game.get_state(), toad_p1)
+        self.assertEqual(self._run_one(TOAD_P1, 2), TOAD_P1)
 
     def test_torus_reproduction_top_left_corner(self):
         """A cell (0, 0) should be born from neighbors wrapping around the edges."""
         initial_state = coords((9, 9), (0, 9), (9, 0))
-        self.game.set_state(initial_state)
-        self.game.step()
-        self.assertIn((0, 0), self.game.get_state())
+        self.assertIn((0, 0), self._run_one(initial_state))
 
     def test_torus_overpopulation_right_edge(self):
         """A cell (9, 5) on the right edge should die from 4 neighbors wrapping around."""
         initial_state = coords((9, 5), (9, 4), (9, 6), (0, 4), (0, 5))
-        self.game.set_state(initial_state)
-        self.game.step()
-        self.assertNotIn((9, 5), self.game.get_state())
+        self.assertNotIn((9, 5), self._run_one(initial_state))
         
     def test_torus_survival_bottom_edge(self):
         """A cell (5, 9) on the bottom edge should survive with 2 neighbors wrapping around."""
         initial_state = coords((5, 9), (5, 0), (6, 9))
-        self.game.set_state(initial_state)
-        self.game.step()
-        self.assertIn((5, 9), self.game.get_state())
+        self.assertIn((5, 9), self._run_one(initial_state))
 
     def test_torus_blinker_on_edge(self):
         """A 'Blinker' crossing the edge should oscillate correctly."""
-        blinker_h_wrap = coords((9, 1), (0, 1), (1, 1))
-        blinker_v_wrap = coords((0, 0), (0, 1), (0, 2))
-        self.game.set_state(blinker_h_wrap)
-        self.game.step()
-        self.assertEqual(self.game.get_state(), blinker_v_wrap)
+        self.assertEqual(self._run_one(BLINKER_H_WRAP), BLINKER_V_WRAP)
     
     def test_spaceship_glider_move(self):
         """The 'Glider' should move diagonally after 4 steps.
@@ -281,38 +431,24 @@ class TestGameOfLife(unittest.TestCase):
         ...#
         .###
         """
-        glider_start = coords((1, 0), (2, 1), (0, 2), (1, 2), (2, 2))
-        self.game.set_state(glider_start)
-
-        for _ in range(4):
-            self.game.step()
-
-        glider_end = self.game.get_state()
-        self.assertEqual(len(glider_end), len(glider_start))
-        expected_translated = translate(glider_start, 1, 1, self.game.width, self.game.height)
-        self.assertEqual(glider_end, expected_translated)
+        self.assertEqual(self._run_one(GLIDER, 4), GLIDER_END)
         
     def test_empty_board(self):
         """An empty grid should remain empty."""
-        self.game.set_state(coords())
-        self.game.step()
-        self.assertEqual(self.game.get_state(), coords())
+        self.assertEqual(self._run_one(coords()), coords())
 
     def test_full_wrapping_board_dies(self):
         """With wrap=True (toroidal), a fully filled grid becomes empty after 1 step."""
-        full_board = coords(*[(x, y) for x in range(10) for y in range(10)])
-        self.game.set_state(full_board)
+        self.game.set_state_flat(set(range(100)))
         self.game.step()
-        self.assertEqual(self.game.get_state(), coords())
+        self.assertEqual(self.game.get_state_flat(), frozenset())
 
     def test_full_board_bounded_differs(self):
         """With wrap=False (bounded), a full 3x3 does not die completely: corners survive."""
-        g = GameOfLife(3, 3, wrap=False)
-        full_board = coords(*[(x, y) for x in range(3) for y in range(3)])
-        g.set_state(full_board)
+        g = self.game_class(3, 3, wrap=False)
+        g.set_state(FULL_3)
         g.step()
-        expected = coords((0, 0), (2, 0), (0, 2), (2, 2))
-        self.assertEqual(g.get_state(), expected)
+        self.assertEqual(g.get_state(), CORNERS_3)
 
     def test_r_pentomino_chaos(self):
         """
@@ -323,8 +459,7 @@ class TestGameOfLife(unittest.TestCase):
         ##..
         .#..
         """
-        r_pentomino_p0 = coords((1, 0), (2, 0), (0, 1), (1, 1), (1, 2))
-        self.game.set_state(r_pentomino_p0)
+        self.game.set_state(R_PENTOMINO)
         s0 = self.game.get_state()
         box0 = bounding_box(s0)
         width0 = box0[2] - box0[0] + 1
@@ -350,27 +485,64 @@ class TestGameOfLife(unittest.TestCase):
 
         self.assertGreaterEqual(width2, width1, "Width should not shrink at step 2")
         self.assertGreaterEqual(height2, height1, "Height should not shrink at step 2")
+        self.assertEqual(self.game.state_hash(), R_PENTOMINO_P2_HASH)
 
-    def test_get_state_is_defensive_copy(self):
-        """get_state() should return a copy, not a reference, to the internal state."""
+    def test_get_state_is_immutable_snapshot(self):
+        """get_state() returns an immutable snapshot that later changes to the grid do not affect."""
         initial_state = coords((1, 1), (2, 2))
         self.game.set_state(initial_state)
 
-        state_copy = self.game.get_state()
-        state_copy.add((3, 3))
+        state = self.game.get_state()
+        self.assertIsInstance(state, frozenset)
+        with self.assertRaises(AttributeError):
+            state.add((3, 3))
+
+        self.game.step()
+        self.assertEqual(state, initial_state, "Snapshot should not change when the grid advances")
+        self.assertEqual(self.game.get_state(), coords(), "A new snapshot should reflect the step")
 
-        self.assertEqual(self.game.get_state(), initial_state, "Internal state should not be affected by mutating the returned set")
+    def test_step_does_not_count_cells_individually(self):
+        """step derives all neighbor counts in one pass instead of calling _get_neighbors_count per cell."""
+        game_class = self.game_class
+
+        class NoPerCellCounts(game_class):
+            def _get_neighbors_count(self, x, y):
+                raise AssertionError("step should not count neighbors cell by cell")
+
+        g = NoPerCellCounts(10, 10, wrap=True)
+        g.set_state(BLINKER_H)
+        g.step()
+        self.assertEqual(g.get_state(), BLINKER_V)
+
+    def test_neighbor_count_matches_brute_force(self):
+        """_get_neighbors_count agrees with a direct count on dense, sparse and tiny boards."""
+        boards = [(5, 5, coords((0, 0), (4, 4), (0, 4), (1, 0), (2, 2), (2, 3), (3, 2), (4, 1)))]
+        for width, height in ((1, 1), (2, 3), (3, 2), (7, 5), (64, 40)):
+            # Dense boards are counted whole, sparse ones cell by cell.
+            dense = {(x, y) for x in range(width) for y in range(height) if (7 * x + 3 * y) % 5 < 2}
+            sparse = coords((0, 0), (width - 1, height - 1), (width // 2, height // 2))
+            boards += [(width, height, dense), (width, height, sparse)]
+        for width, height, cells in boards:
+            for wrap in (True, False):
+                g = self.game_class(width, height, wrap=wrap)
+                g.set_state(cells)
+                for x in range(width):
+                    for y in range(height):
+                        with self.subTest(size=(width, height), wrap=wrap, live=len(cells), cell=(x, y)):
+                            self.assertEqual(
+                                g._get_neighbors_count(x, y), count_neighbors(cells, x, y, width, height, wrap)
+                            )
 
     def test_constructor_validation(self):
         """Constructor validates dimensions and wrap type."""
         with self.assertRaises(ValueError, msg="Width must be positive"):
-            GameOfLife(0, 10)
+            self.game_class(0, 10)
         with self.assertRaises(ValueError, msg="Height must be positive"):
-            GameOfLife(10, 0)
+            self.game_class(10, 0)
         with self.assertRaises(ValueError, msg="Dimensions must be positive"):
-            GameOfLife(-1, -1)
+            self.game_class(-1, -1)
         with self.assertRaises(TypeError, msg="wrap must be a bool"):
-            GameOfLife(5, 5, wrap="yes")
+            self.game_class(5, 5, wrap="yes")
 
     def test_bounding_box_helper(self):
         """The bounding_box helper should work correctly."""
@@ -378,9 +550,15 @@ class TestGameOfLife(unittest.TestCase):
         cells = coords((0, 1), (2, 3), (1, 0))
         self.assertEqual(bounding_box(cells), (0, 0, 2, 3))
 
+    def test_canonicalize_helper(self):
+        """The canonicalize helper moves a shape to the origin and accepts sets and frozensets."""
+        self.assertEqual(canonicalize(set()), set())
+        self.assertEqual(canonicalize(translate(GLIDER, 3, 4)), GLIDER)
+        self.assertEqual(canonicalize(frozenset(translate(GLIDER, 3, 4))), GLIDER)
+
     def test_set_state_wraps_out_of_bounds(self):
         """set_state should normalize out-of-bounds coordinates when wrap=True."""
-        g = GameOfLife(5, 5, wrap=True)
+        g = self.game_class(5, 5, wrap=True)
         # (-1, -1) -> (4,4), (5,5) -> (0,0), (6, -2) -> (1,3)
         g.set_state(coords((-1, -1), (5, 5), (6, -2), (2, 2)))
         expected = coords((4, 4), (0, 0), (1, 3), (2, 2))
@@ -388,14 +566,14 @@ class TestGameOfLife(unittest.TestCase):
 
     def test_set_state_ignores_out_of_bounds(self):
         """set_state should ignore out-of-bounds coordinates when wrap=False."""
-        g = GameOfLife(5, 5, wrap=False)
+        g = self.game_class(5, 5, wrap=False)
         g.set_state(coords((-1, 0), (0, -1), (5, 0), (0, 5), (2, 2), (4, 4)))
         expected = coords((2, 2), (4, 4))
         self.assertEqual(g.get_state(), expected)
 
     def test_set_state_rejects_invalid_types(self):
         """set_state should raise ValueError on invalid entries (non 2-int tuples) with clear cases."""
-        g = GameOfLife(5, 5, wrap=True)
+        g = self.game_class(5, 5, wrap=True)
         invalid_inputs = [
             {(1,), (2, 2)},     # tuple length 1
             {("a", 2)},        # non-int element
@@ -407,5 +585,399 @@ class TestGameOfLife(unittest.TestCase):
                 with self.assertRaises(ValueError):
                     g.set_state(case)
 
+    def test_freed_on_del_without_garbage_collection(self):
+        """A used game holds no reference cycle, so dropping the last reference frees it."""
+        gc.disable()
+        self.addCleanup(gc.enable)
+        g = self.game_class(10, 10, wrap=True)
+        g.set_state(BLINKER_H)
+        g.step()
+        g.get_state()
+        ref = weakref.ref(g)
+        del g
+        self.assertIsNone(ref())
+
+    def test_live_cells_setter_normalizes_like_set_state(self):
+        """Assigning live_cells wraps cells outside the grid on a torus and drops them when bounded."""
+        cells = coords((-1, 0), (2, 2), (7, 1))
+        for wrap, expected in ((True, coords((4, 0), (2, 2), (2, 1))), (False, coords((2, 2)))):
+            with self.subTest(wrap=wrap):
+                g = self.game_class(5, 5, wrap=wrap)
+                g.live_cells = cells
+                self.assertEqual(g.get_state(), expected)
+                self.assertEqual(g.get_state_flat(), {pack(x, y, 5) for x, y in expected})
+                g.step()
+
+    def test_set_state_accepts_a_generator(self):
+        """set_state reads its input only once, so a generator of cells is fully applied."""
+        self.game.set_state((x, 2) for x in (1, 2, 3))
+        self.assertEqual(self.game.get_state(), BLINKER_H)
+
+    def test_clear_empties_the_board(self):
+        """clear() kills every cell and leaves a board that evolves like a fresh one."""
+        self.game.set_state(FULL_10)
+        self.game.clear()
+        self.assertEqual(self.game.get_state(), coords())
+        self.game.step()
+        self.assertEqual(self.game.get_state(), coords())
+        self.game.set_state(BLINKER_H)
+        self.game.step()
+        self.assertEqual(self.game.get_state(), BLINKER_V)
+
+    def test_run_matches_repeated_step(self):
+        """run(n) lands on the same state as n calls to step(); run(0) changes nothing."""
+        stepped = self.game_class(10, 10, wrap=True)
+        stepped.set_state(R_PENTOMINO)
+        for _ in range(7):
+            stepped.step()
+        self.game.set_state(R_PENTOMINO)
+        self.game.run(7)
+        self.assertEqual(self.game.get_state(), stepped.get_state())
+        self.game.run(0)
+        self.assertEqual(self.game.get_state(), stepped.get_state())
+        with self.assertRaises(ValueError):
+            self.game.run(-1)
+
+    def test_flat_state_round_trip(self):
+        """set_state_flat/get_state_flat use y * width + x indices and agree with the tuple API."""
+        self.assertEqual(BLINKER_H_FLAT, {21, 22, 23})
+        self.game.set_state_flat(BLINKER_H_FLAT)
+        self.assertEqual(self.game.get_state(), BLINKER_H)
+        self.game.step()
+        self.assertEqual(self.game.get_state_flat(), BLINKER_V_FLAT)
+
+        g = self.game_class(7, 3, wrap=False)
+        g.set_state(coords((6, 0), (0, 2), (3, 1)))
+        self.assertEqual(g.get_state_flat(), {pack(6, 0, 7), pack(0, 2, 7), pack(3, 1, 7)})
+
+    def test_set_state_flat_rejects_invalid_indices(self):
+        """set_state_flat raises ValueError for indices outside the grid or of the wrong type."""
+        for case in ({-1}, {100}, {1.0}, {"3"}):
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    self.game.set_state_flat(case)
+
+    def test_unchanged_step_keeps_snapshot(self):
+        """A step that changes nothing leaves get_state() returning the very same frozenset."""
+        self.game.set_state(BOAT)
+        state = self.game.get_state()
+        self.game.run(2)
+        self.assertEqual(self.game.get_state(), BOAT)
+        if self.keeps_unchanged_snapshot:
+            self.assertIs(self.game.get_state(), state)
+
+    def test_fixed_point_then_new_state(self):
+        """Stepping a still life repeatedly keeps it, and a new state after it evolves normally."""
+        self.assertEqual(self._run_one(BLOCK, 3), BLOCK)
+        self.assertEqual(self._run_one(coords(), 2), coords())
+        self.assertEqual(self._run_one(BLINKER_H), BLINKER_V)
+
+    def test_state_bits_round_trip(self):
+        """set_state_bits/get_state_bits use bit y * width + x and agree with the tuple API."""
+        self.assertEqual(BLINKER_H_BITS, sum(1 << pack(x, y) for x, y in BLINKER_H))
+        self.assertEqual(BLINKER_V_BITS, sum(1 << pack(x, y) for x, y in BLINKER_V))
+        self.game.set_state_bits(BLINKER_H_BITS)
+        self.assertEqual(self.game.get_state(), BLINKER_H)
+        self.game.step()
+        self.assertEqual(self.game.get_state_bits(), BLINKER_V_BITS)
+        self.game.set_state(FULL_10)
+        self.assertEqual(self.game.get_state_bits(), (1 << 100) - 1)
+        self.game.set_state_bits(0)
+        self.assertEqual(self.game.get_state(), coords())
+
+    def test_set_state_bits_rejects_invalid_boards(self):
+        """set_state_bits raises ValueError for negative, oversized or non-integer boards."""
+        for case in (-1, 1 << 100, 1.0):
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    self.game.set_state_bits(case)
+
+    @unittest.skipUnless(numpy is not None, "NumPy is not installed")
+    def test_state_array_round_trip(self):
+        """set_state_array/get_state_array use element [y, x] and agree with the tuple API."""
+        board = to_array(BLINKER_H)
+        self.game.set_state_array(board)
+        self.assertEqual(self.game.get_state(), BLINKER_H)
+        self.game.step()
+        state = self.game.get_state_array()
+        self.assertEqual(state.dtype, numpy.uint8)
+        numpy.testing.assert_array_equal(state, to_array(BLINKER_V))
+        state[0, 0] = 1
+        self.assertNotIn((0, 0), self.game.get_state(), "get_state_array must return a copy")
+        self.game.set_state_array(board.astype(bool))
+        self.assertEqual(self.game.get_state(), BLINKER_H)
+        self.game.set_state_array(numpy.zeros((10, 10), dtype=numpy.uint8))
+        self.assertEqual(self.game.get_state(), coords())
+
+    @unittest.skipUnless(numpy is not None, "NumPy is not installed")
+    def test_set_state_coords_matches_set_state(self):
+        """set_state_coords takes (x, y) rows and normalizes them like set_state."""
+        cells = coords((1, 0), (2, 1), (0, 2), (1, 2), (2, 2), (-1, 3), (10, 12), (4, -5))
+        points = numpy.array(sorted(cells), dtype=numpy.int8)
+        for wrap in (True, False):
+            with self.subTest(wrap=wrap):
+                g = self.game_class(10, 10, wrap=wrap)
+                g.set_state(cells)
+                expected = g.get_state()
+                g.set_state_coords(points)
+                self.assertEqual(g.get_state(), expected)
+        self.game.set_state_coords(numpy.empty((0, 2), dtype=numpy.int64))
+        self.assertEqual(self.game.get_state(), coords())
+        for case in (numpy.zeros((3, 3), dtype=numpy.int64), numpy.zeros(2, dtype=numpy.int64), numpy.zeros((1, 2))):
+            with self.subTest(shape=case.shape, dtype=case.dtype):
+                with self.assertRaises(ValueError):
+                    self.game.set_state_coords(case)
+
+    @unittest.skipUnless(numpy is not None, "NumPy is not installed")
+    def test_set_state_array_rejects_invalid_arrays(self):
+        """set_state_array raises ValueError for a wrong shape or values other than 0 and 1."""
+        cases = (numpy.zeros((10, 9), dtype=numpy.uint8), numpy.full((10, 10), 2, dtype=numpy.uint8))
+        for case in cases:
+            with self.subTest(shape=case.shape):
+                with self.assertRaises(ValueError):
+                    self.game.set_state_array(case)
+
+    def test_state_hash_tracks_state(self):
+        """state_hash is equal for equal states and changes when the state does."""
+        other = self.game_class(10, 10, wrap=True)
+        self.game.set_state(BLINKER_H)
+        other.set_state_bits(BLINKER_H_BITS)
+        self.assertEqual(self.game.state_hash(), other.state_hash())
+        before = self.game.state_hash()
+        self.game.step()
+        self.assertNotEqual(self.game.state_hash(), before)
+        self.game.step()
+        self.assertEqual(self.game.state_hash(), before)
+        self.assertLess(before, 1 << 64)
+
+    def test_set_state_replaces_dense_and_sparse_boards(self):
+        """Re-seeding after a full or a sparse board evolves exactly like a freshly seeded set-based engine."""
+        full = {(x, y) for x in range(80) for y in range(60)}
+        for previous in (full, coords((2, 1))):
+            with self.subTest(previous=len(previous)):
+                g = self.game_class(80, 60, wrap=True)
+                g.set_state(previous)
+                self._assert_evolves_like_reference(g, GLIDER, 4)
+
+    def test_set_state_unchecked_normalizes_like_set_state(self):
+        """set_state_unchecked applies the same wrap/bounds normalization without validation."""
+        cells = coords((-1, -1), (5, 5), (6, -2), (2, 2))
+        for wrap in (True, False):
+            with self.subTest(wrap=wrap):
+                checked = self.game_class(5, 5, wrap=wrap)
+                unchecked = self.game_class(5, 5, wrap=wrap)
+                checked.set_state(cells)
+                unchecked.set_state_unchecked(cells)
+                self.assertEqual(unchecked.get_state(), checked.get_state())
+
+
+@unittest.skipUnless(numpy is not None, "NumPy is not installed")
+class TestDenseGameOfLife(TestGameOfLife):
+    """
+    Runs the GameOfLife test suite against the NumPy-backed DenseGameOfLife.
+    """
+
+    game_class = DenseGameOfLife
+    # DenseGameOfLife does not look for unchanged generations; a step always takes a new snapshot.
+    keeps_unchanged_snapshot = False
+
+    def test_grid_matches_live_cells(self):
+        """The dense grid is indexed as grid[y, x] and mirrors the live cell set."""
+        self.game.set_state(coords((1, 2), (3, 4)))
+        self.assertEqual(self.game.grid.shape, (10, 10))
+        self.assertEqual(int(self.game.grid.sum()), 2)
+        self.assertEqual(self.game.grid[2, 1], 1)
+        self.assertEqual(self.game.grid[4, 3], 1)
+
+    def test_set_state_reuses_buffers(self):
+        """set_state clears and refills the existing padded grid instead of allocating a new one."""
+        g = self.game_class(6, 5, wrap=False)
+        g.set_state(coords((0, 0), (5, 4)))
+        g.step()
+        padded = g._padded
+        g.set_state(coords((2, 2), (3, 2)))
+        self.assertIs(g._padded, padded)
+        self.assertEqual(g.get_state(), coords((2, 2), (3, 2)))
+        self.assertEqual(int(padded.sum()), 2)
+
+    def test_step_parallel_matches_step(self):
+        """step_parallel with row bands gives the same generations as step, for both edge modes."""
+        cells = coords((1, 0), (2, 1), (0, 2), (1, 2), (2, 2), (7, 9), (8, 9), (9, 9), (5, 5), (5, 6), (6, 5))
+        for wrap in (True, False):
+            with self.subTest(wrap=wrap):
+                parallel = self.game_class(10, 11, wrap=wrap)
+                self.addCleanup(parallel.close)
+                self._assert_evolves_like_reference(parallel, cells, 5, lambda game: game.step_parallel(3))
+                # After close() the serial step still works on the same game.
+                parallel.close()
+                self._assert_evolves_like_reference(parallel, cells, 2)
+
+    def test_context_manager_releases_step_parallel_resources(self):
+        """Leaving a with block shuts the worker pool down and unlinks the shared buffers."""
+        with self.game_class(10, 11, wrap=True) as g:
+            g.set_state(BLINKER_H)
+            g.step_parallel(2)
+            names = [block.name for block in g._shared_blocks]
+        self.assertIsNone(g._pool)
+        for name in names:
+            with self.assertRaises(FileNotFoundError):
+                SharedMemory(name)
+        self.assertEqual(g.get_state(), BLINKER_V)
+
+    def test_matches_reference_across_tile_boundaries(self):
+        """Patterns straddling the 256-cell tile edges evolve exactly like the set-based engine."""
+        cells = coords(
+            (254, 0), (255, 0), (256, 0), (0, 255), (0, 256), (0, 257), (299, 255), (298, 256), (299, 256),
+            (255, 254), (256, 255), (254, 256), (255, 256), (256, 256), (296, 269), (297, 269), (298, 269), (299, 269),
+        )
+        for engine in (self.game_class, _NumPyDenseGameOfLife):
+            for wrap in (True, False):
+                with self.subTest(engine=engine.__name__, wrap=wrap):
+                    self._assert_evolves_like_reference(engine(300, 270, wrap=wrap), cells, 4)
+
+
+@unittest.skipUnless(numpy is not None, "NumPy is not installed")
+class TestDenseGameOfLifeNumPyStencil(TestGameOfLife):
+    """
+    Runs the GameOfLife test suite against the pure NumPy path of DenseGameOfLife.
+    """
+
+    game_class = _NumPyDenseGameOfLife
+    keeps_unchanged_snapshot = False
+
+
+@unittest.skipUnless(_step_kernel is not None, "Numba is not installed")
+class TestDenseGameOfLifeNumbaKernel(TestGameOfLife):
+    """
+    Runs the GameOfLife test suite against the Numba kernel of DenseGameOfLife.
+    """
+
+    game_class = _NumbaDenseGameOfLife
+    keeps_unchanged_snapshot = False
+
+
+@unittest.skipUnless(numpy is not None, "NumPy is not installed")
+class TestBitPackedGameOfLife(TestGameOfLife):
+    """
+    Runs the GameOfLife test suite against the bit-packed BitPackedGameOfLife.
+    """
+
+    game_class = BitPackedGameOfLife
+
+    def test_word_layout(self):
+        """Cell x of row y is bit x % 64 of word x // 64."""
+        g = self.game_class(70, 2, wrap=True)
+        g.set_state(coords((0, 0), (65, 1)))
+        self.assertEqual(g.words.shape, (2, 2))
+        self.assertEqual(int(g.words[0, 0]), 1)
+        self.assertEqual(int(g.words[1, 1]), 1 << 1)
+
+    def test_pack_unpack_round_trip(self):
+        """Packing a dense board and unpacking it again returns the same cells."""
+        g = self.game_class(70, 3, wrap=True)
+        grid = numpy.zeros((3, 70), dtype=numpy.uint8)
+        grid[0, 0] = grid[1, 63] = grid[1, 64] = grid[2, 69] = 1
+        words = g._pack(grid)
+        self.assertEqual(words.shape, (3, 2))
+        self.assertEqual(int(words[1, 1]), 1)
+        numpy.testing.assert_array_equal(g._unpack(words), grid)
+
+    def test_matches_reference_on_single_word_rows(self):
+        """Rows of up to 64 cells use the single-word rotate and still match the set-based engine."""
+        for width in (1, 3, 10, 64):
+            cells = coords((0, 0), (width - 1, 0), (width - 1, 1), (0, 2), (width // 2, 1), (width // 2, 2))
+            for wrap in (True, False):
+                with self.subTest(width=width, wrap=wrap):
+                    self._assert_evolves_like_reference(self.game_class(width, 5, wrap=wrap), cells, 6)
+
+    def test_torus_blinker_on_edge_bitpacked(self):
+        """Blinkers straddling the edges of a 64-wide torus flip via the word rotate and row wrap."""
+        # One word per row: bit x of words[y, 0] is cell (x, y).
+        cases = (
+            # Horizontal across the left/right edge -> vertical in column 0.
+            (coords((63, 2), (0, 2), (1, 2)), (0, 1, 1, 1, 0)),
+            # Vertical across the top/bottom edge in column 63 -> horizontal over columns 62, 63, 0.
+            (coords((63, 4), (63, 0), (63, 1)), (0xC000000000000001, 0, 0, 0, 0)),
+        )
+        g = self.game_class(64, 5, wrap=True)
+        for cells, expected_words in cases:
+            with self.subTest(cells=sorted(cells)):
+                g.set_state(cells)
+                g.step()
+                words = cupy.asnumpy(g.words) if g.backend == "cuda" else g.words
+                numpy.testing.assert_array_equal(words.ravel(), numpy.array(expected_words, dtype=numpy.uint64))
+                g.step()
+                self.assertEqual(g.get_state(), cells)
+
+    def test_fixed_point_skips_step(self):
+        """Once a generation reproduces its input, later steps keep the same words array."""
+        self.game.set_state(BEEHIVE)
+        self.game.step()
+        words = self.game.words
+        self.game.step()
+        self.assertIs(self.game.words, words)
+        self.assertEqual(self.game.get_state(), BEEHIVE)
+
+    def test_matches_reference_across_word_boundaries(self):
+        """Multi-word rows with a partial last word evolve exactly like the set-based engine."""
+        cells = coords((62, 1), (63, 1), (64, 1), (0, 5), (1, 5), (129, 5), (129, 4), (129, 6), (10, 0), (10, 7), (11, 7))
+        for wrap in (True, False):
+            with self.subTest(wrap=wrap):
+                self._assert_evolves_like_reference(self.game_class(130, 8, wrap=wrap), cells, 6)
+
+    def test_unknown_backend_rejected(self):
+        """Only the numpy and cuda backends are accepted."""
+        with self.assertRaises(ValueError):
+            self.game_class(5, 5, backend="opencl")
+
+
+@unittest.skipUnless(CUDA_AVAILABLE, "CuPy or a CUDA device is not available")
+class TestBitPackedGameOfLifeCuda(TestBitPackedGameOfLife):
+    """
+    Runs the bit-packed test suite with the board stepped on the GPU.
+    """
+
+    game_class = _CudaBitPackedGameOfLife
+
+
+class TestHashLifeGameOfLife(TestGameOfLife):
+    """
+    Runs the GameOfLife test suite against HashLifeGameOfLife.
+    """
+
+    game_class = HashLifeGameOfLife
+
+    def test_advance_matches_repeated_steps(self):
+        """advance(n) equals n single steps, with jumps larger than one generation on a torus."""
+        cells = coords((1, 0), (2, 1), (0, 2), (1, 2), (2, 2), (7, 7), (8, 7), (9, 7), (12, 3), (12, 4), (13, 3))
+        for wrap in (True, False):
+            with self.subTest(wrap=wrap):
+                hashlife = self.game_class(16, 12, wrap=wrap)
+                self._assert_evolves_like_reference(hashlife, cells, 2, lambda game: game.advance(37), 37)
+
+    def test_advance_glider_full_lap(self):
+        """A glider on a 20x20 torus returns to its start after 80 generations."""
+        g = self.game_class(20, 20, wrap=True)
+        g.set_state(GLIDER)
+        g.advance(80)
+        self.assertEqual(g.get_state(), GLIDER)
+
+    def test_advance_rejects_negative(self):
+        """advance() refuses to run backwards."""
+        with self.assertRaises(ValueError):
+            self.game.advance(-1)
+
+
+class TestSharedTestData(unittest.TestCase):
+    """Checks that the module-level test data stays safe to share between tests."""
+
+    def test_module_constants_are_immutable(self):
+        """Module constants must be immutable so tests can run in any order or process."""
+        for name, value in globals().items():
+            if name.isupper():
+                with self.subTest(name):
+                    self.assertNotIsInstance(value, (set, list, dict, bytearray))
+
+
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
\ No newline at end of file
+    unittest.main(verbosity=2)